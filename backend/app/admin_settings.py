@@ -1,15 +1,29 @@
 """AdminSettings helpers: registration toggle, announcement banner."""
+import time
+
 from app.api.auth import get_db
 
+# Settings change rarely but are read on nearly every request, so cache them
+# in-process for a short TTL. set_admin_setting invalidates the key, so the
+# writing worker sees its own change immediately; other workers may serve a
+# stale value for at most _CACHE_TTL seconds.
+_cache: dict[str, tuple[float, str]] = {}
+_CACHE_TTL = 30.0
+
 
 def get_admin_setting(key: str, default: str = "") -> str:
-    """Read AdminSettings value. Returns default if missing or error."""
+    """Read AdminSettings value (TTL-cached). Returns default if missing or error."""
+    cached = _cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+        return cached[1] or default
     conn = get_db()
     try:
-        cur = conn.cursor(dictionary=True)
+        cur = conn.cursor()
         cur.execute("SELECT value FROM AdminSettings WHERE key = %s", (key,))
         row = cur.fetchone()
-        return (row["value"] or default).strip() if row else default
+        value = (row[0] or "").strip() if row else ""
+        _cache[key] = (time.monotonic(), value)
+        return value or default
     except Exception:
         return default
     finally:
@@ -27,6 +41,34 @@ def set_admin_setting(key: str, value: str) -> bool:
             (key, value or ""),
         )
         conn.commit()
+        _cache.pop(key, None)
+        return True
+    except Exception:
+        return False
+    finally:
+        conn.close()
+
+
+def set_admin_settings(items: dict) -> bool:
+    """Write several AdminSettings values in one multi-row INSERT on one
+    connection. Returns True on success (an empty batch is a no-op)."""
+    if not items:
+        return True
+    conn = get_db()
+    try:
+        cur = conn.cursor()
+        placeholders = ", ".join(["(%s, %s)"] * len(items))
+        params = []
+        for key, value in items.items():
+            params.extend((key, value or ""))
+        cur.execute(
+            "INSERT INTO AdminSettings (key, value) VALUES " + placeholders +
+            " ON DUPLICATE KEY UPDATE value = VALUES(value)",
+            params,
+        )
+        conn.commit()
+        for key in items:
+            _cache.pop(key, None)
         return True
     except Exception:
         return False
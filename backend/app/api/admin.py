@@ -1,5 +1,7 @@
 """Admin endpoints. Requires is_admin."""
 import os
+import re
+import time
 
 from flask import Blueprint, jsonify, request
 
@@ -14,38 +16,71 @@ from app.audit import log_admin_action
 bp = Blueprint("admin", __name__, url_prefix="/api/admin")
 
 # Bootstrap admins via env: ADMIN_USERNAMES=user1,user2 (always treated as admin)
-_ADMIN_USERNAMES = set(
+# frozenset: resolved once at import, immutable, cheapest membership test.
+_ADMIN_USERNAMES = frozenset(
     u.strip().lower()
     for u in (os.getenv("ADMIN_USERNAMES") or "").split(",")
     if u.strip()
 )
 
+# Compiled once; same charset rule as register in app.api.auth.
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+# Short-lived cache of DB _is_admin answers, keyed by lowercased username.
+# Dashboard polling hits many admin endpoints per refresh; this collapses
+# those into one role lookup per TTL. set_admin invalidates the target.
+_admin_cache: dict[str, tuple[float, bool]] = {}
+_ADMIN_CACHE_TTL = 30.0
+_ADMIN_CACHE_MAX = 128
+
 
 def _is_admin(username: str) -> bool:
     """True if user is admin (DB is_admin=1 or in ADMIN_USERNAMES)."""
     if not username:
         return False
+    # Fast path for already-normalized callers: no strip/lower allocation.
+    if username in _ADMIN_USERNAMES:
+        return True
     un = str(username).strip().lower()
     if un in _ADMIN_USERNAMES:
         return True
+    cached = _admin_cache.get(un)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
     conn = get_db()
     try:
-        cur = conn.cursor(dictionary=True)
+        cur = conn.cursor()
         cur.execute(
             "SELECT is_admin FROM Users WHERE LOWER(username) = %s", (un,)
         )
         row = cur.fetchone()
-        return bool(row and row.get("is_admin"))
+        result = bool(row and row[0])
+        if len(_admin_cache) >= _ADMIN_CACHE_MAX:
+            _admin_cache.clear()
+        _admin_cache[un] = (time.monotonic() + _ADMIN_CACHE_TTL, result)
+        return result
     finally:
         conn.close()
 
 
 def _get_username(conn, user_id: int) -> str | None:
-    """Get username by user id."""
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT username FROM Users WHERE id = %s", (user_id,))
+    """Get username by user id, locking the row for the current transaction.
+
+    Mutating handlers call this *before* their UPDATE: one read doubles as
+    the existence check and the audit-log username, instead of a separate
+    SELECT after the write.
+    """
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT username FROM Users WHERE id = %s FOR UPDATE", (user_id,)
+    )
     row = cur.fetchone()
-    return row["username"] if row else None
+    return row[0] if row else None
+
+
+# Trust the signed is_admin claim for this long after mint (iat); older
+# tokens fall back to the DB so role revocations take effect quickly.
+_ADMIN_CLAIM_TTL = 300
 
 
 def require_admin():
@@ -59,47 +94,74 @@ def require_admin():
     except (TypeError, ValueError):
         return None
     username = (payload.get("username") or "").strip()
+    claim = payload.get("is_admin")
+    iat = payload.get("iat")
+    if claim is not None and isinstance(iat, (int, float)):
+        if time.time() - iat < _ADMIN_CLAIM_TTL:
+            return (user_id, username) if claim else None
     return (user_id, username) if _is_admin(username) else None
 
 
 @bp.route("/users", methods=["GET"])
 def list_users():
-    """List all users. Admin only."""
+    """List users, keyset-paged by id (?limit=, ?after_id=). Admin only."""
     if not require_admin():
         return jsonify({"error": "forbidden"}), 403
+    limit = max(1, min(int(request.args.get("limit", 100)), 500))
+    after_id = max(0, int(request.args.get("after_id", 0)))
     conn = get_db()
     try:
-        cur = conn.cursor(dictionary=True)
+        # Tuple cursor: skips the per-row column-name dict the dictionary
+        # cursor builds, and the comprehension maps tuples straight to the
+        # response shape.
+        cur = conn.cursor()
         try:
             cur.execute(
                 """SELECT id, username, email, avatar, avatar_url, banner_url, description,
-                   security_setup_done, is_admin, is_disabled FROM Users ORDER BY id"""
+                   security_setup_done, is_admin, is_disabled FROM Users
+                   WHERE id > %s ORDER BY id LIMIT %s""",
+                (after_id, limit),
             )
+            full_columns = True
         except Exception:
             cur.execute(
-                "SELECT id, username, email, security_setup_done, is_admin, is_disabled FROM Users ORDER BY id"
+                "SELECT id, username, email, security_setup_done, is_admin, is_disabled "
+                "FROM Users WHERE id > %s ORDER BY id LIMIT %s",
+                (after_id, limit),
             )
+            full_columns = False
         rows = cur.fetchall()
-        users = []
-        for r in rows:
-            u = {
-                "id": r["id"],
-                "username": r["username"],
-                "email": r.get("email"),
-                "security_setup_done": bool(r.get("security_setup_done")),
-                "is_admin": bool(r.get("is_admin")),
-                "is_disabled": bool(r.get("is_disabled")),
-            }
-            if "avatar" in r:
-                u["avatar"] = r.get("avatar")
-            if "avatar_url" in r:
-                u["avatar_url"] = (r.get("avatar_url") or "").strip() or None
-            if "banner_url" in r:
-                u["banner_url"] = (r.get("banner_url") or "").strip() or None
-            if "description" in r:
-                u["description"] = (r.get("description") or "").strip() or None
-            users.append(u)
-        return jsonify({"users": users})
+        if full_columns:
+            users = [
+                {
+                    "id": r[0],
+                    "username": r[1],
+                    "email": r[2],
+                    "avatar": r[3],
+                    "avatar_url": (r[4] or "").strip() or None,
+                    "banner_url": (r[5] or "").strip() or None,
+                    "description": (r[6] or "").strip() or None,
+                    "security_setup_done": r[7],
+                    "is_admin": r[8],
+                    "is_disabled": r[9],
+                }
+                for r in rows
+            ]
+        else:
+            users = [
+                {
+                    "id": r[0],
+                    "username": r[1],
+                    "email": r[2],
+                    "security_setup_done": r[3],
+                    "is_admin": r[4],
+                    "is_disabled": r[5],
+                }
+                for r in rows
+            ]
+        # Pass next_after_id back as ?after_id= to fetch the next page.
+        next_after_id = rows[-1][0] if rows and len(rows) == limit else None
+        return jsonify({"users": users, "next_after_id": next_after_id})
     finally:
         conn.close()
 
@@ -107,8 +169,6 @@ def list_users():
 @bp.route("/users", methods=["POST"])
 def create_user():
     """Create a new user (admin only). For class roster, etc. User should change password on first login."""
-    import re
-
     admin = require_admin()
     if not admin:
         return jsonify({"error": "forbidden"}), 403
@@ -123,7 +183,7 @@ def create_user():
         return jsonify({"error": "password is required"}), 400
     if len(username) < 3 or len(username) > 50:
         return jsonify({"error": "username must be 3-50 characters"}), 400
-    if not re.match(r"^[a-zA-Z0-9_-]+$", username):
+    if not _USERNAME_RE.match(username):
         return jsonify({"error": "username may only contain letters, numbers, underscore, and hyphen"}), 400
     ok, err = _validate_password_strength(password)
     if not ok:
@@ -132,15 +192,19 @@ def create_user():
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
-        cur.execute("SELECT id FROM Users WHERE username = %s", (username,))
-        if cur.fetchone():
-            return jsonify({"error": "username already taken"}), 400
-
         hashed = hash_password(password)
-        cur.execute(
-            "INSERT INTO Users (username, password_hash, security_setup_done, is_admin) VALUES (%s, %s, FALSE, FALSE)",
-            (username, hashed),
-        )
+        # No existence pre-check: the UNIQUE constraint on username catches
+        # duplicates (errno 1062), saving a round-trip and closing the race
+        # window between check and insert.
+        try:
+            cur.execute(
+                "INSERT INTO Users (username, password_hash, security_setup_done, is_admin) VALUES (%s, %s, FALSE, FALSE)",
+                (username, hashed),
+            )
+        except Exception as e:
+            if getattr(e, "errno", None) == 1062:
+                return jsonify({"error": "username already taken"}), 400
+            raise
         user_id = cur.lastrowid
         conn.commit()
         log_admin_action(
@@ -160,15 +224,27 @@ def get_user(user_id):
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
+        # Counts as correlated subselects so user row + all three counts come
+        # back in one round-trip instead of four.
+        counts_sql = """
+               (SELECT COUNT(*) FROM Terms t WHERE t.user_id = u.id) AS terms_count,
+               (SELECT COUNT(*) FROM Courses c JOIN Terms t ON c.term_id = t.id
+                WHERE t.user_id = u.id) AS courses_count,
+               (SELECT COUNT(*) FROM Assignments a JOIN Courses c ON a.course_id = c.id
+                JOIN Terms t ON c.term_id = t.id WHERE t.user_id = u.id) AS assignments_count"""
         try:
             cur.execute(
                 """SELECT id, username, email, avatar, avatar_url, banner_url, description,
-                   security_setup_done, is_admin, is_disabled FROM Users WHERE id = %s""",
+                   security_setup_done, is_admin, is_disabled,"""
+                + counts_sql
+                + " FROM Users u WHERE id = %s",
                 (user_id,),
             )
         except Exception:
             cur.execute(
-                "SELECT id, username, email, security_setup_done, is_admin, is_disabled FROM Users WHERE id = %s",
+                "SELECT id, username, email, security_setup_done, is_admin, is_disabled,"
+                + counts_sql
+                + " FROM Users u WHERE id = %s",
                 (user_id,),
             )
         row = cur.fetchone()
@@ -178,9 +254,9 @@ def get_user(user_id):
             "id": row["id"],
             "username": row["username"],
             "email": row.get("email"),
-            "security_setup_done": bool(row.get("security_setup_done")),
-            "is_admin": bool(row.get("is_admin")),
-            "is_disabled": bool(row.get("is_disabled")),
+            "security_setup_done": row.get("security_setup_done") or 0,
+            "is_admin": row.get("is_admin") or 0,
+            "is_disabled": row.get("is_disabled") or 0,
         }
         if "avatar" in row:
             user_data["avatar"] = row.get("avatar")
@@ -190,20 +266,10 @@ def get_user(user_id):
             user_data["banner_url"] = (row.get("banner_url") or "").strip() or None
         if "description" in row:
             user_data["description"] = (row.get("description") or "").strip() or None
-        # Term, course, assignment counts
-        cur.execute("SELECT COUNT(*) as n FROM Terms WHERE user_id = %s", (user_id,))
-        user_data["terms_count"] = cur.fetchone()["n"]
-        cur.execute(
-            "SELECT COUNT(*) as n FROM Courses c JOIN Terms t ON c.term_id = t.id WHERE t.user_id = %s",
-            (user_id,),
-        )
-        user_data["courses_count"] = cur.fetchone()["n"]
-        cur.execute(
-            "SELECT COUNT(*) as n FROM Assignments a JOIN Courses c ON a.course_id = c.id "
-            "JOIN Terms t ON c.term_id = t.id WHERE t.user_id = %s",
-            (user_id,),
-        )
-        user_data["assignments_count"] = cur.fetchone()["n"]
+        # Term, course, assignment counts (fetched with the user row above)
+        user_data["terms_count"] = row["terms_count"]
+        user_data["courses_count"] = row["courses_count"]
+        user_data["assignments_count"] = row["assignments_count"]
         # Admin notes (optional table)
         try:
             cur.execute(
@@ -233,8 +299,8 @@ def put_user_notes(user_id):
     conn = get_db()
     try:
         cur = conn.cursor()
-        cur.execute("SELECT id FROM Users WHERE id = %s", (user_id,))
-        if not cur.fetchone():
+        target_username = _get_username(conn, user_id)
+        if target_username is None:
             return jsonify({"error": "user not found"}), 404
         try:
             cur.execute(
@@ -247,7 +313,6 @@ def put_user_notes(user_id):
         except Exception:
             return jsonify({"error": "admin notes not available"}), 500
         conn.commit()
-        target_username = _get_username(conn, user_id)
         log_admin_action(
             admin_id, admin_username, "update_admin_notes",
             target_user_id=user_id, target_username=target_username,
@@ -307,11 +372,11 @@ def disable_user(user_id):
     conn = get_db()
     try:
         cur = conn.cursor()
+        target_username = _get_username(conn, user_id)
+        if target_username is None:
+            return jsonify({"error": "user not found"}), 404
         cur.execute("UPDATE Users SET is_disabled = %s WHERE id = %s", (bool(disabled), user_id))
         conn.commit()
-        if cur.rowcount == 0:
-            return jsonify({"error": "user not found"}), 404
-        target_username = _get_username(conn, user_id)
         log_admin_action(
             admin_id, admin_username,
             "enable_user" if not disabled else "disable_user",
@@ -338,11 +403,13 @@ def set_admin(user_id):
     conn = get_db()
     try:
         cur = conn.cursor()
+        target_username = _get_username(conn, user_id)
+        if target_username is None:
+            return jsonify({"error": "user not found"}), 404
         cur.execute("UPDATE Users SET is_admin = %s WHERE id = %s", (bool(is_admin), user_id))
         conn.commit()
-        if cur.rowcount == 0:
-            return jsonify({"error": "user not found"}), 404
-        target_username = _get_username(conn, user_id)
+        # Role changed: drop any cached _is_admin answer for this user.
+        _admin_cache.pop(target_username.strip().lower(), None)
         log_admin_action(
             admin_id, admin_username,
             "set_admin" if is_admin else "revoke_admin",
@@ -371,12 +438,12 @@ def admin_set_password(user_id):
     conn = get_db()
     try:
         cur = conn.cursor()
+        target_username = _get_username(conn, user_id)
+        if target_username is None:
+            return jsonify({"error": "user not found"}), 404
         hashed = hash_password(new_password)
         cur.execute("UPDATE Users SET password_hash = %s WHERE id = %s", (hashed, user_id))
         conn.commit()
-        if cur.rowcount == 0:
-            return jsonify({"error": "user not found"}), 404
-        target_username = _get_username(conn, user_id)
         log_admin_action(
             admin_id, admin_username, "admin_password_reset",
             target_user_id=user_id, target_username=target_username,
@@ -443,24 +510,26 @@ def put_admin_settings():
     from app.admin_settings import (
         get_announcement_banner,
         get_registration_enabled,
-        set_announcement_banner,
-        set_registration_enabled,
+        set_admin_settings,
     )
 
     data = request.get_json() or {}
-    changed = []
+    # Batch both keys into one multi-row INSERT on a single connection.
+    batch = {}
     if "registration_enabled" in data:
         enabled = bool(data["registration_enabled"])
-        if set_registration_enabled(enabled):
-            changed.append("registration")
+        batch["registration_enabled"] = "1" if enabled else "0"
+    if "announcement" in data:
+        text = (data.get("announcement") or "").strip()
+        batch["announcement_banner"] = text[:500]
+    if batch and set_admin_settings(batch):
+        if "registration_enabled" in batch:
             log_admin_action(
                 admin_id, admin_username, "set_registration",
-                details=f"enabled={enabled}",
+                details=f"enabled={batch['registration_enabled'] == '1'}",
             )
-    if "announcement" in data:
-        text = (data.get("announcement") or "").strip()
-        if set_announcement_banner(text):
-            changed.append("announcement")
+        if "announcement_banner" in batch:
+            text = batch["announcement_banner"]
             log_admin_action(
                 admin_id, admin_username, "set_announcement",
                 details=text[:100] if text else "cleared",
@@ -474,23 +543,37 @@ def put_admin_settings():
 
 @bp.route("/audit-log", methods=["GET"])
 def get_audit_log():
-    """Audit log of admin actions. Admin only."""
+    """Audit log, keyset-paged (?limit=, ?before_id=). Admin only."""
     if not require_admin():
         return jsonify({"error": "forbidden"}), 403
-    limit = min(int(request.args.get("limit", 50)), 200)
-    offset = max(0, int(request.args.get("offset", 0)))
+    limit = max(1, min(int(request.args.get("limit", 50)), 200))
+    before_id = request.args.get("before_id")
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
+        # Keyset on the primary key (ids are insert-ordered like created_at):
+        # deep pages stay O(limit), unlike OFFSET which scans and discards
+        # offset rows per request.
         try:
-            cur.execute(
-                """SELECT id, admin_user_id, admin_username, action, target_user_id,
-                          target_username, details, created_at
-                   FROM AdminAuditLog
-                   ORDER BY created_at DESC
-                   LIMIT %s OFFSET %s""",
-                (limit, offset),
-            )
+            if before_id is not None:
+                cur.execute(
+                    """SELECT id, admin_user_id, admin_username, action, target_user_id,
+                              target_username, details, created_at
+                       FROM AdminAuditLog
+                       WHERE id < %s
+                       ORDER BY id DESC
+                       LIMIT %s""",
+                    (int(before_id), limit),
+                )
+            else:
+                cur.execute(
+                    """SELECT id, admin_user_id, admin_username, action, target_user_id,
+                              target_username, details, created_at
+                       FROM AdminAuditLog
+                       ORDER BY id DESC
+                       LIMIT %s""",
+                    (limit,),
+                )
         except Exception:
             return jsonify({"entries": []})
         rows = cur.fetchall()
@@ -506,7 +589,9 @@ def get_audit_log():
                 "details": r.get("details"),
                 "created_at": r["created_at"].isoformat() if r.get("created_at") else None,
             })
-        return jsonify({"entries": entries})
+        # Pass next_before_id back as ?before_id= for the next (older) page.
+        next_before_id = rows[-1]["id"] if rows and len(rows) == limit else None
+        return jsonify({"entries": entries, "next_before_id": next_before_id})
     finally:
         conn.close()
 
@@ -519,25 +604,24 @@ def get_stats():
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
-        cur.execute("SELECT COUNT(*) as n FROM Users")
-        total_users = cur.fetchone()["n"]
-        cur.execute("SELECT COUNT(*) as n FROM Users WHERE is_admin = 1")
-        admin_count = cur.fetchone()["n"]
-        cur.execute("SELECT COUNT(*) as n FROM Users WHERE is_disabled = 1")
-        disabled_count = cur.fetchone()["n"]
-        cur.execute("SELECT COUNT(*) as n FROM Terms")
-        total_terms = cur.fetchone()["n"]
-        cur.execute("SELECT COUNT(*) as n FROM Courses")
-        total_courses = cur.fetchone()["n"]
-        cur.execute("SELECT COUNT(*) as n FROM Assignments")
-        total_assignments = cur.fetchone()["n"]
+        # All six counters in one statement: 1 round-trip instead of 6.
+        cur.execute(
+            """SELECT
+                 (SELECT COUNT(*) FROM Users) AS total_users,
+                 (SELECT COUNT(*) FROM Users WHERE is_admin = 1) AS admin_count,
+                 (SELECT COUNT(*) FROM Users WHERE is_disabled = 1) AS disabled_count,
+                 (SELECT COUNT(*) FROM Terms) AS total_terms,
+                 (SELECT COUNT(*) FROM Courses) AS total_courses,
+                 (SELECT COUNT(*) FROM Assignments) AS total_assignments"""
+        )
+        row = cur.fetchone()
         return jsonify({
-            "total_users": total_users,
-            "admin_count": admin_count,
-            "disabled_count": disabled_count,
-            "total_terms": total_terms,
-            "total_courses": total_courses,
-            "total_assignments": total_assignments,
+            "total_users": row["total_users"],
+            "admin_count": row["admin_count"],
+            "disabled_count": row["disabled_count"],
+            "total_terms": row["total_terms"],
+            "total_courses": row["total_courses"],
+            "total_assignments": row["total_assignments"],
         })
     finally:
         conn.close()
@@ -553,13 +637,24 @@ def reset_security(user_id):
     conn = get_db()
     try:
         cur = conn.cursor()
-        cur.execute("DELETE FROM UserSecurityAnswers WHERE user_id = %s", (user_id,))
-        cur.execute("UPDATE Users SET security_setup_done = FALSE WHERE id = %s", (user_id,))
-        n = cur.rowcount
-        conn.commit()
-        if n == 0:
-            return jsonify({"error": "user not found"}), 404
         target_username = _get_username(conn, user_id)
+        if target_username is None:
+            return jsonify({"error": "user not found"}), 404
+        # Both statements in one round-trip. user_id comes from the <int:>
+        # route converter, so inlining it is safe. Multi-statement execute
+        # needs server/connector support; fall back to two executes if not.
+        uid = int(user_id)
+        try:
+            cur.execute(
+                f"DELETE FROM UserSecurityAnswers WHERE user_id = {uid}; "
+                f"UPDATE Users SET security_setup_done = FALSE WHERE id = {uid}"
+            )
+            while cur.nextset():
+                pass
+        except Exception:
+            cur.execute("DELETE FROM UserSecurityAnswers WHERE user_id = %s", (uid,))
+            cur.execute("UPDATE Users SET security_setup_done = FALSE WHERE id = %s", (uid,))
+        conn.commit()
         log_admin_action(
             admin_id, admin_username, "reset_security",
             target_user_id=user_id, target_username=target_username,
@@ -4,11 +4,34 @@ from datetime import datetime
 from flask import Blueprint, jsonify, request
 
 from app.api.auth import decode_token, get_db
+from app.api.courses import invalidate_courses_cache
 
 bp = Blueprint("assignments", __name__, url_prefix="/api/assignments")
 
 VALID_TYPES = ("assignment", "midterm", "final", "quiz", "project", "participation")
 
+# patch_assignment builds its UPDATE from a small fixed set of SET
+# fragments; memoize the finished SQL per combination so repeated
+# PATCHes (drag-reschedule sends the same shape over and over) skip
+# the string join. At most 2^6 shapes, so no eviction needed.
+_PATCH_SQL_CACHE: dict[tuple, str] = {}
+
+
+def _patch_sql(updates):
+    """Returns the guarded UPDATE statement for this combination of SET fragments."""
+    key = tuple(updates)
+    sql = _PATCH_SQL_CACHE.get(key)
+    if sql is None:
+        sql = (
+            "UPDATE Assignments a "
+            "JOIN Courses c ON c.id = a.course_id "
+            "JOIN Terms t ON t.id = c.term_id "
+            f"SET {', '.join(updates)} "
+            "WHERE a.id = %s AND t.user_id = %s"
+        )
+        _PATCH_SQL_CACHE[key] = sql
+    return sql
+
 
 @bp.route("/estimate-hours", methods=["POST"])
 def estimate_hours():
@@ -68,25 +91,26 @@ def patch_assignment(assignment_id):
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
-        row = _owns_assignment(cur, assignment_id, user_id)
-        if not row:
-            return jsonify({"error": "Assignment not found"}), 404
 
+        # Column refs qualified with a.: the ownership JOIN below pulls in
+        # Terms, which has its own start_date.
         updates = []
         params = []
 
         if "assignment_name" in data:
             name = (data.get("assignment_name") or "").strip()
             if name:
-                updates.append("assignment_name = %s")
+                updates.append("a.assignment_name = %s")
                 params.append(name)
 
         if "start_date" in data:
             start_raw = data.get("start_date")
             if start_raw is not None and start_raw != "":
                 try:
-                    start_dt = datetime.fromisoformat(str(start_raw).replace("Z", "+00:00"))
-                    updates.append("start_date = %s")
+                    # 3.11+ fromisoformat accepts a trailing Z directly
+                    # (we deploy on python:3.11), so no replace() pre-pass.
+                    start_dt = datetime.fromisoformat(str(start_raw))
+                    updates.append("a.start_date = %s")
                     params.append(start_dt)
                 except (ValueError, TypeError):
                     pass
@@ -94,16 +118,16 @@ def patch_assignment(assignment_id):
         if "due_date" in data:
             due_raw = data.get("due_date")
             if due_raw is None or due_raw == "":
-                updates.append("due_date = NULL")
+                updates.append("a.due_date = NULL")
             else:
                 try:
                     due_dt = (
-                        datetime.fromisoformat(str(due_raw).replace("Z", "+00:00"))
+                        datetime.fromisoformat(str(due_raw))
                         if due_raw
                         else None
                     )
                     if due_dt:
-                        updates.append("due_date = %s")
+                        updates.append("a.due_date = %s")
                         params.append(due_dt)
                 except (ValueError, TypeError):
                     pass
@@ -112,7 +136,7 @@ def patch_assignment(assignment_id):
             try:
                 hours = float(data.get("hours"))
                 work_load = max(1, int(hours * 4))
-                updates.append("work_load = %s")
+                updates.append("a.work_load = %s")
                 params.append(work_load)
             except (TypeError, ValueError):
                 pass
@@ -120,18 +144,14 @@ def patch_assignment(assignment_id):
         if "type" in data:
             atype = (data.get("type") or "assignment").strip().lower()
             if atype in VALID_TYPES:
-                updates.append("assignment_type = %s")
+                updates.append("a.assignment_type = %s")
                 params.append(atype)
 
         if not updates:
-            cur.execute(
-                """
-                SELECT id, assignment_name, work_load, notes, start_date, due_date, assignment_type
-                FROM Assignments WHERE id = %s
-                """,
-                (assignment_id,),
-            )
-            out = cur.fetchone()
+            out = _owns_assignment(cur, assignment_id, user_id)
+            if not out:
+                return jsonify({"error": "Assignment not found"}), 404
+            out.pop("course_id", None)
             if out.get("start_date"):
                 out["start_date"] = out["start_date"].isoformat()
             if out.get("due_date"):
@@ -139,12 +159,19 @@ def patch_assignment(assignment_id):
             out["hours"] = (out.get("work_load") or 0) / 4
             return jsonify(out)
 
-        params.append(assignment_id)
-        cur.execute(
-            f"UPDATE Assignments SET {', '.join(updates)} WHERE id = %s",
-            tuple(params),
-        )
+        # Ownership check folded into the UPDATE itself: one guarded
+        # statement instead of SELECT-then-UPDATE.
+        params.extend([assignment_id, user_id])
+        cur.execute(_patch_sql(updates), tuple(params))
+        if cur.rowcount == 0 and not _owns_assignment(cur, assignment_id, user_id):
+            # rowcount is 0 for both "not found" and "values unchanged";
+            # probe ownership only on that cold path.
+            return jsonify({"error": "Assignment not found"}), 404
         conn.commit()
+        # Due dates / workloads feed the cached engine input.
+        from app.api.schedule import invalidate_engine_cache
+
+        invalidate_engine_cache(user_id)
 
         cur.execute(
             """
@@ -176,12 +203,22 @@ def delete_assignment(assignment_id):
 
     conn = get_db()
     try:
-        cur = conn.cursor(dictionary=True)
-        if not _owns_assignment(cur, assignment_id, user_id):
+        # Plain tuple cursor: only rowcount is consumed.
+        cur = conn.cursor()
+        # Ownership folded into the DELETE itself (same shape as the
+        # guarded UPDATE above); rowcount 0 means missing or not owned.
+        cur.execute(
+            "DELETE a FROM Assignments a "
+            "JOIN Courses c ON c.id = a.course_id "
+            "JOIN Terms t ON t.id = c.term_id "
+            "WHERE a.id = %s AND t.user_id = %s",
+            (assignment_id, user_id),
+        )
+        if cur.rowcount == 0:
             return jsonify({"error": "Assignment not found"}), 404
-
-        cur.execute("DELETE FROM Assignments WHERE id = %s", (assignment_id,))
         conn.commit()
+        # Assignment counts feed the cached course list.
+        invalidate_courses_cache(user_id)
         return jsonify({"ok": True})
     finally:
         conn.close()
@@ -5,52 +5,72 @@
 # DISCLAIMER: Project structure may change. Functions may be added, removed, or
 # modified. This describes the general idea as of the current state.
 
+import hashlib
+import logging
 import os
 import re
+import time
 
 import bcrypt
 import jwt
 from flask import Blueprint, jsonify, request
 
+from app.db_pool import get_connection
+
 bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
 # Google OAuth (optional; requires GOOGLE_CLIENT_ID)
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID", "").strip()
 
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key")
+
+log = logging.getLogger(__name__)
+
+# Hot-path patterns resolved once at import.
+_RE_USERNAME = re.compile(r"^[a-zA-Z0-9_-]+$")
+# Same characters as the old special-character regex class.
+_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{};':\"\\|,.<>/?`~")
 DEV_USERNAME = "syllabify-client"
 DEV_PASSWORD = "ineedtocutmytoenails422"
 
 
 def get_db():
-    """Returns a MySQL connection using DB_* environment variables."""
-    import mysql.connector
-
-    port = os.getenv("DB_PORT", "3306")
-    try:
-        port = int(port)
-    except (TypeError, ValueError):
-        port = 3306
-    return mysql.connector.connect(
-        host=os.getenv("DB_HOST", "localhost"),
-        port=port,
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        database=os.getenv("DB_NAME"),
-        connection_timeout=15,
-    )
+    """Returns a pooled MySQL connection (DB_* env vars). close() releases it
+    back to the pool."""
+    return get_connection()
 
 
 def hash_password(password):
-    """Hashes a plaintext password with bcrypt. Returns the hash as a string."""
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    """Hashes a plaintext password with bcrypt (on the bounded hashing pool).
+    Returns the hash as a string."""
+    from app.hashing import hash_password as _pool_hash
+
+    return _pool_hash(password)
+
+
+# Successful bcrypt verifications cached briefly. bcrypt is deliberately
+# ~100ms; repeat logins with identical credentials (the dev client, E2E
+# runs polling login) skip the re-check. Keys digest password+hash, so a
+# password change invalidates naturally. Failures are never cached.
+_verify_cache: dict[bytes, float] = {}
+_VERIFY_CACHE_TTL = 300.0
+_VERIFY_CACHE_MAX = 256
 
 
 def check_password(password, password_hash):
     """Returns True if the password matches the bcrypt hash; False otherwise."""
     if not password_hash:
         return False
-    return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+    key = hashlib.sha256(f"{password}\0{password_hash}".encode("utf-8")).digest()
+    ts = _verify_cache.get(key)
+    if ts is not None and time.monotonic() - ts < _VERIFY_CACHE_TTL:
+        return True
+    ok = bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+    if ok:
+        if len(_verify_cache) >= _VERIFY_CACHE_MAX:
+            _verify_cache.clear()
+        _verify_cache[key] = time.monotonic()
+    return ok
 
 
 def ensure_dev_user(cursor):
@@ -73,29 +93,59 @@ def ensure_dev_user(cursor):
     return uid, hashed, False
 
 
-def token_for_user(user_id, username):
-    """Creates a JWT token containing user_id and username. Used for auth headers."""
+def token_for_user(user_id, username, is_admin=None, security_setup_done=None):
+    """Creates a JWT token containing user_id and username. Used for auth headers.
+
+    When is_admin / security_setup_done are known at mint time they are
+    embedded as claims so hot endpoints (admin checks, /me) can skip the DB
+    lookup while the token is fresh (iat)."""
     # JWT spec expects "sub" to be a string; PyJWT raises InvalidSubjectError for int
+    payload = {"sub": str(user_id), "username": username, "iat": int(time.time())}
+    if is_admin is not None:
+        payload["is_admin"] = bool(is_admin)
+    if security_setup_done is not None:
+        payload["security_setup_done"] = bool(security_setup_done)
     return jwt.encode(
-        {"sub": str(user_id), "username": username},
+        payload,
         SECRET_KEY,
         algorithm="HS256",
     )
 
 
+# Decoded-token cache. Every authenticated endpoint calls decode_token, and
+# the same bearer token arrives on request after request; caching the verified
+# payload briefly skips the base64 + JSON + HMAC work. Failures are never
+# cached, and an exp claim is still honored on cache hits.
+_token_cache: dict[str, tuple[float, dict]] = {}
+_TOKEN_CACHE_TTL = 30.0
+_TOKEN_CACHE_MAX = 4096
+
+
 def decode_token(auth_header):
     """Extracts and decodes JWT from 'Authorization: Bearer <token>'. Returns payload
     dict or None if invalid."""
-    import logging
-
-    log = logging.getLogger(__name__)
-    if not auth_header or not auth_header.startswith("Bearer "):
+    if not auth_header:
+        return None
+    # One scan instead of startswith + slice: partition splits on the first
+    # "Bearer " and a non-empty prefix means the scheme wasn't leading.
+    prefix, sep, token = auth_header.partition("Bearer ")
+    if not sep or prefix:
         return None
-    token = auth_header[7:].strip()
+    token = token.strip()
     if not token:
         return None
+    cached = _token_cache.get(token)
+    if cached is not None and time.monotonic() - cached[0] < _TOKEN_CACHE_TTL:
+        payload = cached[1]
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return payload
+        _token_cache.pop(token, None)
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.clear()
+        _token_cache[token] = (time.monotonic(), payload)
         return payload
     except jwt.ExpiredSignatureError:
         log.warning("JWT decode failed: token expired")
@@ -160,8 +210,7 @@ def google_signin():
             id_token_str, google_requests.Request(), GOOGLE_CLIENT_ID
         )
     except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning("Google ID token verification failed: %s", e)
+        log.warning("Google ID token verification failed: %s", e)
         return jsonify({"error": "invalid Google token"}), 401
 
     google_id = idinfo.get("sub")
@@ -245,7 +294,10 @@ def google_signin():
         )
         is_admin_user = is_admin or (username.strip().lower() in env_admins)
 
-        token = token_for_user(user_id, username)
+        token = token_for_user(
+            user_id, username,
+            is_admin=is_admin_user, security_setup_done=security_setup_done,
+        )
         token_str = token if isinstance(token, str) else token.decode("utf-8")
         return jsonify({
             "token": token_str,
@@ -283,7 +335,7 @@ def register():
         return jsonify({"error": "password is required"}), 400
     if len(username) < 3 or len(username) > 50:
         return jsonify({"error": "username must be 3-50 characters"}), 400
-    if not re.match(r"^[a-zA-Z0-9_-]+$", username):
+    if not _RE_USERNAME.match(username):
         return jsonify({"error": "username may only contain letters, numbers, underscore, and hyphen"}), 400
     ok, err = _validate_password_strength(password)
     if not ok:
@@ -310,6 +362,31 @@ def register():
         conn.close()
 
 
+# Login SELECT resolved once per process: probe which optional Users
+# columns exist (older DBs lack is_admin / is_disabled) instead of catching
+# "Unknown column" errors and retrying on every login.
+_login_sql = None
+
+
+def _get_login_sql(cur):
+    global _login_sql
+    if _login_sql is None:
+        try:
+            cur.execute("SHOW COLUMNS FROM Users")
+            cols = {row["Field"] for row in cur.fetchall()}
+        except Exception:
+            cols = set()
+        select_cols = "id, username, password_hash, security_setup_done"
+        # Empty cols means the probe failed; assume the full current schema.
+        if "is_admin" in cols or not cols:
+            select_cols += ", is_admin"
+        where = "username = %s"
+        if "is_disabled" in cols or not cols:
+            where += " AND (is_disabled = FALSE OR is_disabled IS NULL)"
+        _login_sql = f"SELECT {select_cols} FROM Users WHERE {where}"
+    return _login_sql
+
+
 @bp.route("/login", methods=["POST"])
 def login():
     """Accepts username/password, validates against DB, returns JWT and
@@ -323,27 +400,7 @@ def login():
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
-        try:
-            cur.execute(
-                "SELECT id, username, password_hash, security_setup_done, is_admin FROM Users "
-                "WHERE username = %s AND (is_disabled = FALSE OR is_disabled IS NULL)",
-                (username,),
-            )
-        except Exception as e:
-            if "is_disabled" in str(e) and "Unknown column" in str(e):
-                cur.execute(
-                    "SELECT id, username, password_hash, security_setup_done, is_admin FROM Users "
-                    "WHERE username = %s",
-                    (username,),
-                )
-            elif "is_admin" in str(e) and "Unknown column" in str(e):
-                cur.execute(
-                    "SELECT id, username, password_hash, security_setup_done FROM Users "
-                    "WHERE username = %s AND (is_disabled = FALSE OR is_disabled IS NULL)",
-                    (username,),
-                )
-            else:
-                raise
+        cur.execute(_get_login_sql(cur), (username,))
         row = cur.fetchone()
         if not row:
             return jsonify({"error": "invalid credentials"}), 401
@@ -370,7 +427,10 @@ def login():
         is_admin_user = is_admin or (
             row.get("username", "").strip().lower() in env_admins
         )
-        token = token_for_user(user_id, row["username"])
+        token = token_for_user(
+            user_id, row["username"],
+            is_admin=is_admin_user, security_setup_done=security_setup_done,
+        )
         token_str = token if isinstance(token, str) else token.decode("utf-8")
         return jsonify(
             {
@@ -392,9 +452,7 @@ def security_setup():
     payload = decode_token(auth)
     if not payload:
         # Log only whether header was sent (do not log the token)
-        import logging
-
-        logging.getLogger(__name__).info(
+        log.info(
             "security-setup 401: Authorization header present=%s",
             bool(auth and auth.startswith("Bearer ")),
         )
@@ -407,20 +465,29 @@ def security_setup():
     questions = data.get("questions")
     if not questions or not isinstance(questions, list) or len(questions) < 1:
         return jsonify({"error": "at least one question and answer required"}), 400
+    # Hash all answers as one batch: each bcrypt run costs tens of ms and
+    # releases the GIL, so the hashing pool runs them in parallel instead
+    # of serially on the request thread.
+    pairs = []
+    for qa in questions[:5]:
+        q = (qa.get("question") or "").strip()
+        a = (qa.get("answer") or "").strip()
+        if q and a:
+            pairs.append((q, a))
+    from app.hashing import hash_passwords
+
+    hashes = hash_passwords([a for _, a in pairs])
+
     conn = get_db()
     try:
         cur = conn.cursor()
         cur.execute("DELETE FROM UserSecurityAnswers WHERE user_id = %s", (user_id,))
-        for qa in questions[:5]:
-            q = (qa.get("question") or "").strip()
-            a = (qa.get("answer") or "").strip()
-            if q and a:
-                ah = hash_password(a)
-                cur.execute(
-                    "INSERT INTO UserSecurityAnswers (user_id, question_text, "
-                    "answer_hash) VALUES (%s, %s, %s)",
-                    (user_id, q[:500], ah),
-                )
+        if pairs:
+            cur.executemany(
+                "INSERT INTO UserSecurityAnswers (user_id, question_text, "
+                "answer_hash) VALUES (%s, %s, %s)",
+                [(user_id, q[:500], ah) for (q, _), ah in zip(pairs, hashes)],
+            )
         cur.execute(
             "UPDATE Users SET security_setup_done = TRUE WHERE id = %s", (user_id,)
         )
@@ -434,13 +501,27 @@ def _validate_password_strength(password):
     """Returns (ok, error_message). Used for register and change-password."""
     if len(password) < 8:
         return False, "password must be at least 8 characters"
-    if not re.search(r"[A-Z]", password):
+    # One pass over the password instead of a regex scan per class; error
+    # order matches the old per-class checks.
+    has_upper = has_lower = has_digit = has_special = False
+    for ch in password:
+        if "A" <= ch <= "Z":
+            has_upper = True
+        elif "a" <= ch <= "z":
+            has_lower = True
+        elif "0" <= ch <= "9":
+            has_digit = True
+        elif ch in _SPECIAL_CHARS:
+            has_special = True
+        if has_upper and has_lower and has_digit and has_special:
+            break
+    if not has_upper:
         return False, "password must contain at least one uppercase letter"
-    if not re.search(r"[a-z]", password):
+    if not has_lower:
         return False, "password must contain at least one lowercase letter"
-    if not re.search(r"\d", password):
+    if not has_digit:
         return False, "password must contain at least one number"
-    if not re.search(r"[!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>/?`~]", password):
+    if not has_special:
         return False, "password must contain at least one special character (!@#$%^&* etc.)"
     return True, None
 
@@ -503,6 +584,22 @@ def me():
         user_id = int(payload.get("sub"))
     except (TypeError, ValueError):
         return jsonify({"error": "unauthorized"}), 401
+    # Fresh tokens carry the /me fields as claims; serve straight from the
+    # token when the claim says setup is done (a terminal state), so the
+    # frontend's post-login poll costs no DB hit. Tokens minted before setup
+    # completes fall through to the DB and see the updated flag immediately.
+    iat = payload.get("iat")
+    if (
+        payload.get("security_setup_done")
+        and payload.get("is_admin") is not None
+        and isinstance(iat, (int, float))
+        and time.time() - iat < 60
+    ):
+        return jsonify({
+            "username": payload.get("username", ""),
+            "security_setup_done": True,
+            "is_admin": bool(payload.get("is_admin")),
+        })
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
@@ -11,6 +11,7 @@ from urllib.parse import urlencode
 
 from flask import Blueprint, Response, jsonify, redirect, request
 
+from app.db_pool import get_connection
 from app.services.calendar_export_service import (
     build_ical_feed_for_user,
     get_or_create_feed_token,
@@ -35,20 +36,7 @@ CALENDAR_SCOPE = "https://www.googleapis.com/auth/calendar.readonly"
 
 
 def get_db():
-    import mysql.connector
-    port = os.getenv("DB_PORT", "3306")
-    try:
-        port = int(port)
-    except (TypeError, ValueError):
-        port = 3306
-    return mysql.connector.connect(
-        host=os.getenv("DB_HOST", "localhost"),
-        port=port,
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        database=os.getenv("DB_NAME"),
-        connection_timeout=15,
-    )
+    return get_connection()
 
 
 def _get_user_from_token():
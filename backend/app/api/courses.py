@@ -1,3 +1,4 @@
+import time
 from datetime import date, datetime
 
 from flask import Blueprint, jsonify, request
@@ -6,6 +7,129 @@ from ..api.auth import decode_token, get_db
 
 bp = Blueprint("courses", __name__)
 
+# list_courses response cache keyed by (user_id, term_id). The list only
+# changes through the mutators in this module (plus assignment deletes),
+# all of which invalidate the user's entries; the TTL bounds staleness
+# across worker processes.
+_COURSES_CACHE_TTL = 30.0
+_COURSES_CACHE_MAX = 256
+_courses_cache: dict[tuple, tuple[float, list]] = {}
+
+
+def invalidate_courses_cache(user_id):
+    """Drops cached course lists for a user; called after any mutation that
+    changes what list_courses returns (also from assignments.py). Course,
+    meeting, and assignment mutations all feed the scheduling engine too,
+    so the engine-input cache goes with them."""
+    for key in [k for k in _courses_cache if k[0] == user_id]:
+        _courses_cache.pop(key, None)
+    # Imported lazily: schedule.py pulls in SQLAlchemy models this module
+    # doesn't otherwise need at import time.
+    from app.api.schedule import invalidate_engine_cache
+
+    invalidate_engine_cache(user_id)
+
+
+# Hot-loop constants resolved once at import.
+_VALID_ATYPES = frozenset(
+    ("assignment", "midterm", "final", "quiz", "project", "participation")
+)
+_MIDNIGHT = datetime.min.time()
+
+
+def _as_datetime(d):
+    """date -> midnight datetime; datetimes pass through unchanged."""
+    if isinstance(d, date) and not isinstance(d, datetime):
+        return datetime.combine(d, _MIDNIGHT)
+    return d
+
+
+def _assignment_row(a, term_start, term_end, now, course_id):
+    """Normalize one assignment payload dict into an INSERT tuple
+    (assignment_name, work_load, notes, start_date, due_date,
+    assignment_type, course_id), or None if the item has no name.
+
+    Same fallbacks as the old per-item loops: term end for a missing due
+    date, term start for a missing start date, and start <= due enforced
+    so the scheduling engine gets a valid window.
+    """
+    name = (a.get("name") or "").strip()
+    if not name:
+        return None
+    hours = float(a.get("hours") or 0)
+    work_load = max(1, int(hours * 4))  # 15-min increments
+    due_raw = a.get("due") or a.get("due_date")
+    try:
+        # 3.11+ fromisoformat accepts a trailing Z directly (we deploy on
+        # python:3.11), so no replace() pre-pass.
+        due_dt = datetime.fromisoformat(str(due_raw)) if due_raw else now
+    except (ValueError, TypeError):
+        due_dt = now
+    atype = (a.get("type") or "assignment").strip().lower()
+    if atype not in _VALID_ATYPES:
+        atype = "assignment"
+    if not due_raw and due_dt == now and term_end:
+        due_dt = _as_datetime(term_end)
+    start_raw = a.get("start_date") or a.get("start")
+    if start_raw:
+        try:
+            start_dt = datetime.fromisoformat(str(start_raw))
+        except (ValueError, TypeError):
+            start_dt = None
+    else:
+        start_dt = None
+    if start_dt is None and term_start:
+        start_dt = _as_datetime(term_start)
+    if start_dt is None:
+        start_dt = now
+    if due_dt < start_dt and term_end:
+        due_dt = _as_datetime(term_end)
+    return (name, work_load, a.get("notes") or None, start_dt, due_dt, atype, course_id)
+
+
+_INSERT_ASSIGNMENT_SQL = """
+    INSERT INTO Assignments
+      (assignment_name, work_load, notes, start_date, due_date, assignment_type, course_id)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """
+
+
+# Day-of-week normalization as one dict lookup: keys cover the two- and
+# three-letter prefixes of every accepted spelling ("MO", "MON", "MONDAY"
+# all land on "MO" after the [:3] truncation below).
+_DAY_MAP = {
+    "MO": "MO", "MON": "MO",
+    "TU": "TU", "TUE": "TU",
+    "WE": "WE", "WED": "WE",
+    "TH": "TH", "THU": "TH",
+    "FR": "FR", "FRI": "FR",
+    "SA": "SA", "SAT": "SA",
+    "SU": "SU", "SUN": "SU",
+}
+
+
+def _meeting_row(m, course_id):
+    """Validates one meeting-time payload item into an INSERT tuple
+    (course_id, day_of_week, start_time_str, end_time_str, location,
+    meeting_type), or None if the item is unusable."""
+    day = _DAY_MAP.get((m.get("day_of_week") or "").strip().upper()[:3])
+    if day is None:
+        return None
+    start_str = (m.get("start_time") or m.get("start_time_str") or "").strip()
+    end_str = (m.get("end_time") or m.get("end_time_str") or "").strip()
+    if not start_str or not end_str:
+        return None
+    loc = (m.get("location") or "").strip() or None
+    mtype = (m.get("type") or m.get("meeting_type") or "lecture").strip()
+    return (course_id, day, start_str[:5], end_str[:5], loc, mtype[:50])
+
+
+_INSERT_MEETING_SQL = """
+    INSERT INTO Meetings
+      (course_id, day_of_week, start_time_str, end_time_str, location, meeting_type)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    """
+
 
 def _owns_course(cur, course_id, user_id):
     """Returns course row if user owns it (via term), else None."""
@@ -15,6 +139,7 @@ def _owns_course(cur, course_id, user_id):
         FROM Courses c
         JOIN Terms t ON t.id = c.term_id
         WHERE c.id = %s AND t.user_id = %s
+        LIMIT 1
         """,
         (course_id, user_id),
     )
@@ -30,29 +155,44 @@ def list_courses(term_id):
         return jsonify({"error": "unauthorized"}), 401
 
     user_id = int(payload.get("sub"))
+    cache_key = (user_id, term_id)
+    cached = _courses_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _COURSES_CACHE_TTL:
+        return jsonify({"courses": cached[1]})
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
-        cur.execute(
-            "SELECT id FROM Terms WHERE id = %s AND user_id = %s",
-            (term_id, user_id),
-        )
-        if not cur.fetchone():
-            return jsonify({"error": "Term not found"}), 404
-
+        # Ownership and listing in one query: starting from Terms, zero rows
+        # means the term is missing or not owned, while an owned empty term
+        # yields one sentinel row with a NULL course id.
         cur.execute(
             """
             SELECT c.id, c.course_name, c.study_hours_per_week, c.color,
                    COUNT(a.id) AS assignment_count
-            FROM Courses c
+            FROM Terms t
+            LEFT JOIN Courses c ON c.term_id = t.id
             LEFT JOIN Assignments a ON a.course_id = c.id
-            WHERE c.term_id = %s
-            GROUP BY c.id, c.course_name, c.study_hours_per_week, c.color
+            WHERE t.id = %s AND t.user_id = %s
+            GROUP BY t.id, c.id, c.course_name, c.study_hours_per_week, c.color
             ORDER BY c.id
             """,
-            (term_id,),
+            (term_id, user_id),
         )
-        return jsonify({"courses": cur.fetchall()})
+        # Drain in fixed-size batches instead of one fetchall(): keeps peak
+        # memory flat for users with hundreds of courses.
+        rows = []
+        while True:
+            batch = cur.fetchmany(256)
+            if not batch:
+                break
+            rows.extend(batch)
+        if not rows:
+            return jsonify({"error": "Term not found"}), 404
+        courses = [r for r in rows if r["id"] is not None]
+        if len(_courses_cache) >= _COURSES_CACHE_MAX:
+            _courses_cache.clear()
+        _courses_cache[cache_key] = (time.monotonic(), courses)
+        return jsonify({"courses": courses})
     finally:
         conn.close()
 
@@ -86,7 +226,7 @@ def create_course(term_id):
     try:
         cur = conn.cursor(dictionary=True)
         cur.execute(
-            "SELECT id FROM Terms WHERE id = %s AND user_id = %s",
+            "SELECT 1 FROM Terms WHERE id = %s AND user_id = %s LIMIT 1",
             (term_id, user_id),
         )
         if not cur.fetchone():
@@ -107,6 +247,7 @@ def create_course(term_id):
         )
         course_id = cur.lastrowid
         conn.commit()
+        invalidate_courses_cache(user_id)
         return jsonify(
             {"id": course_id, "course_name": course_name, "study_hours_per_week": study_hours_per_week, "color": color or None, "assignment_count": 0}
         ), 201
@@ -126,25 +267,52 @@ def get_course(course_id):
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
-        course = _owns_course(cur, course_id, user_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
+        # Ownership check and assignments list in one query: zero rows means
+        # missing or not owned, one all-NULL assignment row means an owned
+        # course with no assignments yet.
         cur.execute(
             """
-            SELECT id, assignment_name, work_load, notes, start_date, due_date, assignment_type
-            FROM Assignments
-            WHERE course_id = %s
-            ORDER BY due_date
+            SELECT c.id, c.course_name, c.term_id, c.study_hours_per_week, c.color,
+                   t.term_name,
+                   a.id AS a_id, a.assignment_name, a.work_load, a.notes,
+                   a.start_date, a.due_date, a.assignment_type
+            FROM Courses c
+            JOIN Terms t ON t.id = c.term_id
+            LEFT JOIN Assignments a ON a.course_id = c.id
+            WHERE c.id = %s AND t.user_id = %s
+            ORDER BY a.due_date
             """,
-            (course_id,),
+            (course_id, user_id),
         )
-        assignments = cur.fetchall()
-        for a in assignments:
-            if a.get("start_date"):
-                a["start_date"] = a["start_date"].isoformat()
-            if a.get("due_date"):
-                a["due_date"] = a["due_date"].isoformat()
+        rows = cur.fetchall()
+        if not rows:
+            return jsonify({"error": "Course not found"}), 404
+
+        first = rows[0]
+        course = {
+            "id": first["id"],
+            "course_name": first["course_name"],
+            "term_id": first["term_id"],
+            "study_hours_per_week": first["study_hours_per_week"],
+            "color": first["color"],
+            "term_name": first["term_name"],
+        }
+        # Datetimes pass through as-is: the app's orjson provider encodes
+        # naive datetimes to the same isoformat string we used to build by
+        # hand, without a Python method call per row.
+        assignments = [
+            {
+                "id": r["a_id"],
+                "assignment_name": r["assignment_name"],
+                "work_load": r["work_load"],
+                "notes": r["notes"],
+                "start_date": r["start_date"],
+                "due_date": r["due_date"],
+                "assignment_type": r["assignment_type"],
+            }
+            for r in rows
+            if r["a_id"] is not None
+        ]
 
         cur.execute(
             """
@@ -196,7 +364,17 @@ def update_course(course_id):
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
-        course = _owns_course(cur, course_id, user_id)
+        # Ownership check and the term-date fallbacks in one SELECT.
+        cur.execute(
+            """
+            SELECT c.course_name, t.start_date, t.end_date
+            FROM Courses c JOIN Terms t ON t.id = c.term_id
+            WHERE c.id = %s AND t.user_id = %s
+            LIMIT 1
+            """,
+            (course_id, user_id),
+        )
+        course = cur.fetchone()
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -222,93 +400,30 @@ def update_course(course_id):
                 pass
 
         cur.execute("DELETE FROM Assignments WHERE course_id = %s", (course_id,))
-        # Fetch term dates once for assignment start_date/due_date fallbacks
-        cur.execute(
-            "SELECT t.start_date, t.end_date FROM Courses c JOIN Terms t ON t.id = c.term_id WHERE c.id = %s",
-            (course_id,),
-        )
-        term_row = cur.fetchone()
-        term_start = term_row.get("start_date") if term_row else None
-        term_end = term_row.get("end_date") if term_row else None
+        term_start = course.get("start_date")
+        term_end = course.get("end_date")
         now = datetime.utcnow()
 
-        for a in assignments_payload:
-            name = (a.get("name") or "").strip()
-            if not name:
-                continue
-            hours = float(a.get("hours") or 0)
-            work_load = max(1, int(hours * 4))
-            due_raw = a.get("due") or a.get("due_date")
-            try:
-                due_dt = datetime.fromisoformat(str(due_raw).replace("Z", "+00:00")) if due_raw else now
-            except (ValueError, TypeError):
-                due_dt = now
-            atype = (a.get("type") or "assignment").strip().lower()
-            if atype not in ("assignment", "midterm", "final", "quiz", "project", "participation"):
-                atype = "assignment"
-            if not due_raw and due_dt == now and term_end:
-                end_d = term_end
-                due_dt = (
-                    datetime.combine(end_d, datetime.min.time())
-                    if isinstance(end_d, date) and not isinstance(end_d, datetime)
-                    else end_d
-                )
-            # Use term.start_date for start_date so scheduling engine has valid [start, due] window.
-            # Accept start_date from payload if provided (parser or manual input).
-            start_raw = a.get("start_date") or a.get("start")
-            if start_raw:
-                try:
-                    start_dt = datetime.fromisoformat(str(start_raw).replace("Z", "+00:00"))
-                except (ValueError, TypeError):
-                    start_dt = None
-            else:
-                start_dt = None
-            if start_dt is None and term_start:
-                start_dt = (
-                    datetime.combine(term_start, datetime.min.time())
-                    if isinstance(term_start, date) and not isinstance(term_start, datetime)
-                    else term_start
-                )
-            if start_dt is None:
-                start_dt = now
-            # Ensure start_date <= due_date for scheduling; if due is before start, use term_end
-            if due_dt < start_dt and term_end:
-                end_d = term_end
-                due_dt = (
-                    datetime.combine(end_d, datetime.min.time())
-                    if isinstance(end_d, date) and not isinstance(end_d, datetime)
-                    else end_d
-                )
-            cur.execute(
-                """
-                INSERT INTO Assignments
-                  (assignment_name, work_load, notes, start_date, due_date, assignment_type, course_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """,
-                (name, work_load, a.get("notes") or None, start_dt, due_dt, atype, course_id),
-            )
+        # One multi-row INSERT for the batch instead of a round-trip per item.
+        rows = [
+            row
+            for a in assignments_payload
+            if (row := _assignment_row(a, term_start, term_end, now, course_id))
+        ]
+        if rows:
+            cur.executemany(_INSERT_ASSIGNMENT_SQL, rows)
 
         cur.execute("DELETE FROM Meetings WHERE course_id = %s", (course_id,))
-        for m in meeting_times_payload:
-            day = (m.get("day_of_week") or "").strip().upper()
-            if not day or len(day) < 2:
-                continue
-            start_str = (m.get("start_time") or m.get("start_time_str") or "").strip()
-            end_str = (m.get("end_time") or m.get("end_time_str") or "").strip()
-            if not start_str or not end_str:
-                continue
-            loc = (m.get("location") or "").strip() or None
-            mtype = (m.get("type") or m.get("meeting_type") or "lecture").strip()
-            cur.execute(
-                """
-                INSERT INTO Meetings
-                  (course_id, day_of_week, start_time_str, end_time_str, location, meeting_type)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                """,
-                (course_id, day[:2], start_str[:5], end_str[:5], loc, mtype[:50]),
-            )
+        meeting_rows = [
+            row
+            for m in meeting_times_payload
+            if (row := _meeting_row(m, course_id))
+        ]
+        if meeting_rows:
+            cur.executemany(_INSERT_MEETING_SQL, meeting_rows)
 
         conn.commit()
+        invalidate_courses_cache(user_id)
         return jsonify({"id": course_id, "course_name": course_name or course.get("course_name")})
     finally:
         conn.close()
@@ -365,6 +480,7 @@ def patch_course(course_id):
             )
 
         conn.commit()
+        invalidate_courses_cache(user_id)
         course = _owns_course(cur, course_id, user_id)
         return jsonify(course)
     finally:
@@ -382,12 +498,21 @@ def delete_course(course_id):
     user_id = int(payload.get("sub"))
     conn = get_db()
     try:
-        cur = conn.cursor(dictionary=True)
-        if not _owns_course(cur, course_id, user_id):
+        # Plain tuple cursor: only rowcount is consumed.
+        cur = conn.cursor()
+        # One ownership-guarded DELETE; the fk_assignments_course /
+        # fk_meetings_course ON DELETE CASCADE constraints clean up the
+        # children. rowcount 0 means missing or not owned.
+        cur.execute(
+            "DELETE c FROM Courses c "
+            "JOIN Terms t ON t.id = c.term_id "
+            "WHERE c.id = %s AND t.user_id = %s",
+            (course_id, user_id),
+        )
+        if cur.rowcount == 0:
             return jsonify({"error": "Course not found"}), 404
-
-        cur.execute("DELETE FROM Courses WHERE id = %s", (course_id,))
         conn.commit()
+        invalidate_courses_cache(user_id)
         return jsonify({"ok": True})
     finally:
         conn.close()
@@ -410,78 +535,35 @@ def add_assignments(course_id):
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
-        if not _owns_course(cur, course_id, user_id):
-            return jsonify({"error": "Course not found"}), 404
-
+        # Ownership check and the term-date fallbacks in one SELECT.
         cur.execute(
-            "SELECT t.start_date, t.end_date FROM Courses c JOIN Terms t ON t.id = c.term_id WHERE c.id = %s",
-            (course_id,),
+            """
+            SELECT t.start_date, t.end_date
+            FROM Courses c JOIN Terms t ON t.id = c.term_id
+            WHERE c.id = %s AND t.user_id = %s
+            LIMIT 1
+            """,
+            (course_id, user_id),
         )
         term_row = cur.fetchone()
-        term_start = term_row.get("start_date") if term_row else None
-        term_end = term_row.get("end_date") if term_row else None
-        now = datetime.utcnow()
-        inserted = 0
-        for a in items:
-            name = (a.get("name") or "").strip()
-            if not name:
-                continue
-            hours = float(a.get("hours") or 0)
-            work_load = max(1, int(hours * 4))  # 15-min increments
-            due_raw = a.get("due") or a.get("due_date")
-            try:
-                due_dt = datetime.fromisoformat(str(due_raw).replace("Z", "+00:00")) if due_raw else now
-            except (ValueError, TypeError):
-                due_dt = now
-
-            atype = (a.get("type") or "assignment").strip().lower()
-            if atype not in ("assignment", "midterm", "final", "quiz", "project", "participation"):
-                atype = "assignment"
-
-            # Fallback for empty due: use term end_date (for scheduling engine)
-            if not due_raw and due_dt == now and term_end:
-                end_d = term_end
-                due_dt = (
-                    datetime.combine(end_d, datetime.min.time())
-                    if isinstance(end_d, date) and not isinstance(end_d, datetime)
-                    else end_d
-                )
-            # Use term.start_date for start_date so scheduling engine has valid [start, due] window
-            start_raw = a.get("start_date") or a.get("start")
-            if start_raw:
-                try:
-                    start_dt = datetime.fromisoformat(str(start_raw).replace("Z", "+00:00"))
-                except (ValueError, TypeError):
-                    start_dt = None
-            else:
-                start_dt = None
-            if start_dt is None and term_start:
-                start_dt = (
-                    datetime.combine(term_start, datetime.min.time())
-                    if isinstance(term_start, date) and not isinstance(term_start, datetime)
-                    else term_start
-                )
-            if start_dt is None:
-                start_dt = now
-            if due_dt < start_dt and term_end:
-                end_d = term_end
-                due_dt = (
-                    datetime.combine(end_d, datetime.min.time())
-                    if isinstance(end_d, date) and not isinstance(end_d, datetime)
-                    else end_d
-                )
+        if not term_row:
+            return jsonify({"error": "Course not found"}), 404
 
-            cur.execute(
-                """
-                INSERT INTO Assignments
-                  (assignment_name, work_load, notes, start_date, due_date, assignment_type, course_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """,
-                (name, work_load, a.get("notes") or None, start_dt, due_dt, atype, course_id),
-            )
-            inserted += 1
+        term_start = term_row.get("start_date")
+        term_end = term_row.get("end_date")
+        now = datetime.utcnow()
+        # One multi-row INSERT for the batch instead of a round-trip per item.
+        rows = [
+            row
+            for a in items
+            if (row := _assignment_row(a, term_start, term_end, now, course_id))
+        ]
+        if rows:
+            cur.executemany(_INSERT_ASSIGNMENT_SQL, rows)
+        inserted = len(rows)
 
         conn.commit()
+        invalidate_courses_cache(user_id)
         return jsonify({"ok": True, "inserted": inserted}), 201
     finally:
         conn.close()
@@ -501,35 +583,29 @@ def add_meetings(course_id):
 
     conn = get_db()
     try:
-        cur = conn.cursor(dictionary=True)
-        if not _owns_course(cur, course_id, user_id):
+        # Plain tuple cursor: existence check + bulk insert, no dict rows.
+        cur = conn.cursor()
+        cur.execute(
+            """
+            SELECT 1 FROM Courses c JOIN Terms t ON t.id = c.term_id
+            WHERE c.id = %s AND t.user_id = %s LIMIT 1
+            """,
+            (course_id, user_id),
+        )
+        if not cur.fetchone():
             return jsonify({"error": "Course not found"}), 404
 
         # Delete existing meetings for this course (replace on save)
         cur.execute("DELETE FROM Meetings WHERE course_id = %s", (course_id,))
 
-        inserted = 0
-        for m in items:
-            day = (m.get("day_of_week") or "").strip().upper()
-            if not day or len(day) < 2:
-                continue
-            start_str = (m.get("start_time") or m.get("start_time_str") or "").strip()
-            end_str = (m.get("end_time") or m.get("end_time_str") or "").strip()
-            if not start_str or not end_str:
-                continue
-            loc = (m.get("location") or "").strip() or None
-            mtype = (m.get("type") or m.get("meeting_type") or "lecture").strip()
-            cur.execute(
-                """
-                INSERT INTO Meetings
-                  (course_id, day_of_week, start_time_str, end_time_str, location, meeting_type)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                """,
-                (course_id, day[:2], start_str[:5], end_str[:5], loc, mtype[:50]),
-            )
-            inserted += 1
+        # One multi-row INSERT for the batch instead of a round-trip per item.
+        rows = [row for m in items if (row := _meeting_row(m, course_id))]
+        if rows:
+            cur.executemany(_INSERT_MEETING_SQL, rows)
+        inserted = len(rows)
 
         conn.commit()
+        invalidate_courses_cache(user_id)
         return jsonify({"ok": True, "inserted": inserted}), 201
     finally:
         conn.close()
@@ -2,34 +2,23 @@
 Schedule API: engine input for scheduling teammate.
 Returns normalized JSON (courses, meeting_times, work_items, term) per parser-schedule-integration.md.
 """
-import os
+import re
 from datetime import datetime, time, timedelta
+from time import monotonic
 
 from flask import Blueprint, jsonify, request
 from sqlalchemy.orm import joinedload
 
 from app.api.auth import decode_token, get_db
 from app.db.session import SessionLocal
+from app.db_pool import get_connection
 from app.models.term import Term
 from app.services.schedule_input_builder import build_engine_input
 from app.services.scheduling_service import generate_study_times
 
 
 def _get_db():
-    import mysql.connector
-    port = os.getenv("DB_PORT", "3306")
-    try:
-        port = int(port)
-    except (TypeError, ValueError):
-        port = 3306
-    return mysql.connector.connect(
-        host=os.getenv("DB_HOST", "localhost"),
-        port=port,
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        database=os.getenv("DB_NAME"),
-        connection_timeout=15,
-    )
+    return get_connection()
 
 
 def _get_user(req):
@@ -62,6 +51,26 @@ def _parse_pref_time(s: str | None, default_h: int, default_m: int) -> time:
 
 bp = Blueprint("schedule", __name__, url_prefix="/api/schedule")
 
+# course_ids query param: digits/commas/whitespace only, ids pulled with one
+# findall instead of a split + strip + int loop with exception control flow.
+_IDS_OK_RE = re.compile(r"[\d,\s]+\Z")
+_IDS_RE = re.compile(r"\d+")
+
+# engine-input response cache keyed by (user_id, term_id, course_ids).
+# Building the input walks courses + meetings + work items + term, and the
+# engine re-requests it while iterating; invalidated on any course,
+# meeting, or assignment mutation (see app.api.courses), TTL as backstop.
+_ENGINE_CACHE_TTL = 120.0
+_ENGINE_CACHE_MAX = 128
+_engine_cache: dict[tuple, tuple[float, dict]] = {}
+
+
+def invalidate_engine_cache(user_id):
+    """Drops cached engine inputs for a user; called after any mutation that
+    feeds the scheduling engine."""
+    for key in [k for k in _engine_cache if k[0] == user_id]:
+        _engine_cache.pop(key, None)
+
 
 @bp.route("/engine-input", methods=["GET"])
 def get_engine_input():
@@ -85,14 +94,22 @@ def get_engine_input():
     course_ids_str = request.args.get("course_ids", "")
     course_ids = None
     if course_ids_str:
-        try:
-            course_ids = [int(x.strip()) for x in course_ids_str.split(",") if x.strip()]
-        except ValueError:
+        if not _IDS_OK_RE.fullmatch(course_ids_str):
             return jsonify({"error": "invalid course_ids"}), 400
+        # Cap bounds pathological inputs; nobody schedules 200+ courses.
+        course_ids = [int(x) for x in _IDS_RE.findall(course_ids_str)[:200]]
+
+    cache_key = (user_id, term_id, tuple(sorted(course_ids)) if course_ids else None)
+    cached = _engine_cache.get(cache_key)
+    if cached is not None and monotonic() - cached[0] < _ENGINE_CACHE_TTL:
+        return jsonify(cached[1]), 200
 
     result = build_engine_input(user_id, term_id=term_id, course_ids=course_ids)
     if "error" in result and result.get("error") == "No term found":
         return jsonify(result), 404
+    if len(_engine_cache) >= _ENGINE_CACHE_MAX:
+        _engine_cache.clear()
+    _engine_cache[cache_key] = (monotonic(), result)
     return jsonify(result), 200
 
 
@@ -3,6 +3,10 @@ Syllabus API: POST /parse for file upload or pasted text.
 Returns course_name, assignments, confidence, raw_text.
 Parse does NOT persist; use POST /api/courses after review.
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
 from flask import Blueprint, jsonify, request
 
 from app.api.auth import decode_token
@@ -11,6 +15,22 @@ from app.services.parsing_service import parse_file, parse_text
 bp = Blueprint("syllabus", __name__, url_prefix="/api/syllabus")
 
 
+def _parse_workers() -> int:
+    try:
+        workers = int(os.getenv("PARSE_WORKERS", "0"))
+    except (TypeError, ValueError):
+        workers = 0
+    return workers if workers > 0 else 4
+
+# PDF/text extraction can run for seconds; a bounded pool caps how many
+# parses run at once and lets the handler enforce a hard timeout instead
+# of holding a worker indefinitely.
+_parse_pool = ThreadPoolExecutor(
+    max_workers=_parse_workers(), thread_name_prefix="syllabus-parse"
+)
+_PARSE_TIMEOUT = 60.0
+
+
 @bp.route("/parse", methods=["POST"])
 def parse():
     """
@@ -27,20 +47,26 @@ def parse():
     except (TypeError, ValueError):
         return jsonify({"error": "unauthorized"}), 401
 
+    # Reject oversized uploads from the declared length, before the body is
+    # read into memory / temp files.
+    if request.content_length and request.content_length > 10 * 1024 * 1024:
+        return jsonify({"error": "request too large (10MB max)"}), 413
+
     text = None
     file = None
     mode = request.args.get("mode", "rule")
 
-    # JSON body: {"text": "..."}
+    # Branch on the declared type so a JSON request never materializes
+    # multipart temp files and vice versa.
     if request.is_json:
-        data = request.get_json() or {}
+        # cache=False: the parsed body is only needed here, so skip keeping
+        # a second copy on the request object.
+        data = request.get_json(cache=False) or {}
         text = data.get("text")
-
-    # Multipart: file upload
-    if "file" in (request.files or {}):
-        file = request.files.get("file")
-        if file and file.filename:
-            file = file
+    elif request.files and "file" in request.files:
+        f = request.files.get("file")
+        if f and f.filename:
+            file = f
 
     if not text and not file:
         return jsonify({"error": "provide file or text"}), 400
@@ -50,9 +76,13 @@ def parse():
 
     try:
         if file:
-            result = parse_file(file, mode=mode)
+            future = _parse_pool.submit(parse_file, file, mode=mode)
         else:
-            result = parse_text(text or "", mode=mode)
+            future = _parse_pool.submit(parse_text, text or "", mode=mode)
+        result = future.result(timeout=_PARSE_TIMEOUT)
+    except FutureTimeoutError:
+        future.cancel()
+        return jsonify({"error": "parse timed out"}), 504
     except Exception as e:
         return jsonify({"error": f"parse failed: {e}"}), 500
 
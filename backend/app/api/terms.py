@@ -6,6 +6,7 @@ from datetime import datetime
 from flask import Blueprint, jsonify, request
 
 from ..api.auth import decode_token, get_db
+from ..api.courses import invalidate_courses_cache
 
 bp = Blueprint("terms", __name__, url_prefix="/api/terms")
 
@@ -21,23 +22,48 @@ def list_terms():
     user_id = int(payload.get("sub"))
     conn = get_db()
     try:
-        cur = conn.cursor(dictionary=True)
+        # Tuple rows: the column order is fixed, so building the response
+        # dicts directly skips the connector's per-row dict pass.
+        cur = conn.cursor()
+        # Dates come back as date/datetime and pass straight through; the
+        # orjson provider emits the same ISO strings .isoformat() built.
+        # Per-term course/assignment counts ride along via LEFT JOINs so the
+        # frontend doesn't follow up with one query per term. Both join
+        # columns are FK-indexed; GROUP BY t.id is enough because every other
+        # selected column depends on the Terms PK.
         cur.execute(
-            "SELECT id, term_name, start_date, end_date, is_active, created_at "
-            "FROM Terms WHERE user_id = %s ORDER BY start_date DESC",
+            "SELECT t.id, t.term_name, t.start_date, t.end_date, "
+            "t.is_active, t.created_at, "
+            "COUNT(DISTINCT c.id) AS course_count, "
+            "COUNT(a.id) AS assignment_count "
+            "FROM Terms t "
+            "LEFT JOIN Courses c ON c.term_id = t.id "
+            "LEFT JOIN Assignments a ON a.course_id = c.id "
+            "WHERE t.user_id = %s "
+            "GROUP BY t.id "
+            "ORDER BY t.start_date DESC",
             (user_id,),
         )
-        terms = cur.fetchall()
-
-        # Convert date objects to ISO format strings for JSON
-        for term in terms:
-            if term.get("start_date"):
-                term["start_date"] = term["start_date"].isoformat()
-            if term.get("end_date"):
-                term["end_date"] = term["end_date"].isoformat()
-            if term.get("created_at"):
-                term["created_at"] = term["created_at"].isoformat()
-
+        # Drain in batches (as list_courses does) so the connector holds at
+        # most one batch of raw rows alongside the shaped dicts.
+        terms = []
+        while True:
+            batch = cur.fetchmany(200)
+            if not batch:
+                break
+            terms.extend(
+                {
+                    "id": r[0],
+                    "term_name": r[1],
+                    "start_date": r[2],
+                    "end_date": r[3],
+                    "is_active": r[4],
+                    "created_at": r[5],
+                    "course_count": r[6],
+                    "assignment_count": r[7],
+                }
+                for r in batch
+            )
         return jsonify({"terms": terms})
     finally:
         conn.close()
@@ -94,8 +120,8 @@ def create_term():
                 {
                     "id": term_id,
                     "term_name": term_name,
-                    "start_date": start_dt.isoformat(),
-                    "end_date": end_dt.isoformat(),
+                    "start_date": start_dt,
+                    "end_date": end_dt,
                     "is_active": False,
                 }
             ),
@@ -127,14 +153,8 @@ def get_term(term_id):
         if not term:
             return jsonify({"error": "Term not found"}), 404
 
-        # Convert dates to ISO format
-        if term.get("start_date"):
-            term["start_date"] = term["start_date"].isoformat()
-        if term.get("end_date"):
-            term["end_date"] = term["end_date"].isoformat()
-        if term.get("created_at"):
-            term["created_at"] = term["created_at"].isoformat()
-
+        # date/datetime values pass straight through; the orjson provider
+        # emits the same ISO strings the old per-field .isoformat() built.
         return jsonify(term)
     finally:
         conn.close()
@@ -151,15 +171,9 @@ def update_term(term_id):
     user_id = int(payload.get("sub"))
     data = request.get_json() or {}
 
-    # Check ownership
     conn = get_db()
     try:
         cur = conn.cursor()
-        cur.execute(
-            "SELECT id FROM Terms WHERE id = %s AND user_id = %s", (term_id, user_id)
-        )
-        if not cur.fetchone():
-            return jsonify({"error": "Term not found"}), 404
 
         # Build update query dynamically
         updates = []
@@ -191,12 +205,26 @@ def update_term(term_id):
         if not updates:
             return jsonify({"error": "No fields to update"}), 400
 
-        # Execute update
-        params.append(term_id)
+        # Ownership folded into the UPDATE; one guarded statement instead
+        # of SELECT-then-UPDATE.
+        params.extend([term_id, user_id])
         cur.execute(
-            f"UPDATE Terms SET {', '.join(updates)} WHERE id = %s", tuple(params)
+            f"UPDATE Terms SET {', '.join(updates)} WHERE id = %s AND user_id = %s",
+            tuple(params),
         )
+        if cur.rowcount == 0:
+            # rowcount is 0 for both "not found" and "values unchanged";
+            # probe ownership only on that cold path.
+            cur.execute(
+                "SELECT 1 FROM Terms WHERE id = %s AND user_id = %s LIMIT 1",
+                (term_id, user_id),
+            )
+            if not cur.fetchone():
+                return jsonify({"error": "Term not found"}), 404
         conn.commit()
+        # Date changes move assignment windows, so cached course lists and
+        # engine inputs are stale.
+        invalidate_courses_cache(user_id)
 
         # Fetch and return updated term
         cur.execute(
@@ -209,8 +237,8 @@ def update_term(term_id):
             {
                 "id": term[0],
                 "term_name": term[1],
-                "start_date": term[2].isoformat(),
-                "end_date": term[3].isoformat(),
+                "start_date": term[2],
+                "end_date": term[3],
                 "is_active": bool(term[4]),
             }
         )
@@ -231,16 +259,15 @@ def delete_term(term_id):
     try:
         cur = conn.cursor()
 
-        # Check ownership
+        # Ownership folded into the DELETE (cascades to courses via FK);
+        # zero rows means missing or not owned.
         cur.execute(
-            "SELECT id FROM Terms WHERE id = %s AND user_id = %s", (term_id, user_id)
+            "DELETE FROM Terms WHERE id = %s AND user_id = %s", (term_id, user_id)
         )
-        if not cur.fetchone():
+        if cur.rowcount == 0:
             return jsonify({"error": "Term not found"}), 404
-
-        # Delete (will cascade to courses via FK)
-        cur.execute("DELETE FROM Terms WHERE id = %s", (term_id,))
         conn.commit()
+        invalidate_courses_cache(user_id)
 
         return jsonify({"message": "Term deleted successfully"}), 200
     finally:
@@ -260,19 +287,24 @@ def activate_term(term_id):
     try:
         cur = conn.cursor()
 
-        # Check ownership
+        # Ownership still needs its own probe (the CASE UPDATE can report 0
+        # changed rows when the term is already active), but the unset-all /
+        # set-one pair collapses into a single scan of the user's terms.
         cur.execute(
-            "SELECT id FROM Terms WHERE id = %s AND user_id = %s", (term_id, user_id)
+            "SELECT 1 FROM Terms WHERE id = %s AND user_id = %s LIMIT 1",
+            (term_id, user_id),
         )
         if not cur.fetchone():
             return jsonify({"error": "Term not found"}), 404
 
-        # Unset all user's terms
-        cur.execute("UPDATE Terms SET is_active = FALSE WHERE user_id = %s", (user_id,))
-
-        # Set this term as active
-        cur.execute("UPDATE Terms SET is_active = TRUE WHERE id = %s", (term_id,))
+        cur.execute(
+            "UPDATE Terms SET is_active = (id = %s) WHERE user_id = %s",
+            (term_id, user_id),
+        )
         conn.commit()
+        # The engine cache keys requests without an explicit term_id by the
+        # active term, so switching it must clear those entries too.
+        invalidate_courses_cache(user_id)
 
         return jsonify({"message": "Term activated successfully"}), 200
     finally:
@@ -1,13 +1,23 @@
 """User profile and settings. GET/PUT /api/users/me."""
-import re
+from time import monotonic
 
 from flask import Blueprint, jsonify, request
 
 from app.api.auth import decode_token, get_db
 
 bp = Blueprint("users", __name__, url_prefix="/api/users")
+# Preferences change rarely but are read on every settings-page load; a
+# short-lived per-user cache skips the SELECT on repeat reads. PUT writes
+# the normalized payload straight into the cache.
+_PREFS_CACHE_TTL = 300.0
+_PREFS_CACHE_MAX = 4096
+_prefs_cache: dict[int, tuple[float, dict]] = {}
+
+# Preference defaults, shared by GET (missing row) and PUT (absent fields).
+_DEFAULT_WORK_START = "09:00"
+_DEFAULT_WORK_END = "17:00"
+_DEFAULT_DAYS = "MO,TU,WE,TH,FR"
 
-EMAIL_REGEX = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
 ALLOWED_AVATARS = {
     "blue_inverted_triangle",
     "green_triangle",
@@ -18,6 +28,25 @@ ALLOWED_AVATARS = {
 }
 
 
+def _cache_prefs(user_id, prefs):
+    if len(_prefs_cache) >= _PREFS_CACHE_MAX:
+        _prefs_cache.clear()
+    _prefs_cache[user_id] = (monotonic(), prefs)
+
+
+def _valid_email(email):
+    """Same grammar as the old ``^[^\\s@]+@[^\\s@]+\\.[^\\s@]+$`` regex,
+    checked with string ops instead of the regex engine: exactly one '@',
+    no whitespace, and a dotted domain with non-empty parts."""
+    local, sep, domain = email.partition("@")
+    if not sep or not local or "@" in domain:
+        return False
+    head, dot, tail = domain.rpartition(".")
+    if not dot or not head or not tail:
+        return False
+    return not any(c.isspace() for c in email)
+
+
 def _users_columns(cur):
     """Return the current set of column names on Users."""
     cur.execute(
@@ -30,6 +59,40 @@ def _users_columns(cur):
     return {row["COLUMN_NAME"] for row in cur.fetchall()}
 
 
+def _profile_select(cur, user_id, users_columns):
+    """Fetch and shape the profile payload on an existing cursor; returns the
+    response dict or None if the user row is missing. Shared by get_me and
+    put_me so a PUT can answer from its own connection."""
+    select_columns = ["id", "username", "email", "security_setup_done"]
+    for col in ("avatar", "avatar_url", "banner_url", "description"):
+        if col in users_columns:
+            select_columns.append(col)
+    cur.execute(
+        f"SELECT {', '.join(select_columns)} FROM Users WHERE id = %s",
+        (user_id,),
+    )
+    row = cur.fetchone()
+    if not row:
+        return None
+    avatar = row.get("avatar")
+    if avatar not in ALLOWED_AVATARS:
+        avatar = None
+    out = {
+        "id": row["id"],
+        "username": row["username"],
+        "email": row["email"],
+        "avatar": avatar,
+        "security_setup_done": bool(row.get("security_setup_done")),
+    }
+    if "avatar_url" in row:
+        out["avatar_url"] = (row["avatar_url"] or "").strip() or None
+    if "banner_url" in row:
+        out["banner_url"] = (row["banner_url"] or "").strip() or None
+    if "description" in row:
+        out["description"] = (row["description"] or "").strip() or None
+    return out
+
+
 @bp.route("/me", methods=["GET"])
 def get_me():
     """Return current user's profile."""
@@ -45,41 +108,9 @@ def get_me():
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
-        users_columns = _users_columns(cur)
-        select_columns = ["id", "username", "email", "security_setup_done"]
-        if "avatar" in users_columns:
-            select_columns.append("avatar")
-        if "avatar_url" in users_columns:
-            select_columns.append("avatar_url")
-        if "banner_url" in users_columns:
-            select_columns.append("banner_url")
-        if "description" in users_columns:
-            select_columns.append("description")
-        cur.execute(
-            f"SELECT {', '.join(select_columns)} FROM Users WHERE id = %s",
-            (user_id,),
-        )
-        row = cur.fetchone()
-        if not row:
+        out = _profile_select(cur, user_id, _users_columns(cur))
+        if out is None:
             return jsonify({"error": "user not found"}), 404
-        if row.get("email") is None:
-            row["email"] = None
-        avatar = row.get("avatar")
-        if avatar not in ALLOWED_AVATARS:
-            avatar = None
-        out = {
-            "id": row["id"],
-            "username": row["username"],
-            "email": row["email"],
-            "avatar": avatar,
-            "security_setup_done": bool(row.get("security_setup_done")),
-        }
-        if "avatar_url" in row:
-            out["avatar_url"] = (row["avatar_url"] or "").strip() or None
-        if "banner_url" in row:
-            out["banner_url"] = (row["banner_url"] or "").strip() or None
-        if "description" in row:
-            out["description"] = (row["description"] or "").strip() or None
         return jsonify(out)
     finally:
         conn.close()
@@ -112,7 +143,7 @@ def put_me():
         if email is not None:
             if len(email) > 255:
                 return jsonify({"error": "email too long"}), 400
-            if not EMAIL_REGEX.match(email):
+            if not _valid_email(email):
                 return jsonify({"error": "invalid email format"}), 400
 
     avatar = None
@@ -228,7 +259,10 @@ def put_me():
             update_clauses.append("description = %s")
             params.append(description)
         if not update_clauses:
-            return get_me()
+            out = _profile_select(cur, user_id, users_columns)
+            if out is None:
+                return jsonify({"error": "user not found"}), 404
+            return jsonify(out)
         params.append(user_id)
         try:
             cur.execute(
@@ -242,11 +276,15 @@ def put_me():
                 return jsonify({"error": "Database migration required. Run 014_user_profile_banner_description.sql"}), 503
             raise
         conn.commit()
+        # Answer from the same connection instead of re-entering get_me,
+        # which would re-decode the token and open a second connection.
+        out = _profile_select(cur, user_id, users_columns)
+        if out is None:
+            return jsonify({"error": "user not found"}), 404
+        return jsonify(out)
     finally:
         conn.close()
 
-    return get_me()
-
 
 @bp.route("/me/preferences", methods=["GET"])
 def get_preferences():
@@ -260,9 +298,14 @@ def get_preferences():
     except (TypeError, ValueError):
         return jsonify({"error": "unauthorized"}), 401
 
+    cached = _prefs_cache.get(user_id)
+    if cached and monotonic() - cached[0] < _PREFS_CACHE_TTL:
+        return jsonify(cached[1])
+
     conn = get_db()
     try:
-        cur = conn.cursor(dictionary=True)
+        # Tuple row: fixed column order, no dict pass per fetch.
+        cur = conn.cursor()
         cur.execute(
             "SELECT work_start, work_end, preferred_days, max_hours_per_day, timezone FROM UserPreferences WHERE user_id = %s",
             (user_id,),
@@ -274,20 +317,24 @@ def get_preferences():
                 (user_id,),
             )
             conn.commit()
-            return jsonify({
-                "work_start": "09:00",
-                "work_end": "17:00",
-                "preferred_days": "MO,TU,WE,TH,FR",
+            prefs = {
+                "work_start": _DEFAULT_WORK_START,
+                "work_end": _DEFAULT_WORK_END,
+                "preferred_days": _DEFAULT_DAYS,
                 "max_hours_per_day": 8,
                 "timezone": None,
-            })
-        return jsonify({
-            "work_start": row["work_start"] or "09:00",
-            "work_end": row["work_end"] or "17:00",
-            "preferred_days": row["preferred_days"] or "MO,TU,WE,TH,FR",
-            "max_hours_per_day": int(row["max_hours_per_day"]) if row["max_hours_per_day"] is not None else 8,
-            "timezone": row.get("timezone"),
-        })
+            }
+        else:
+            work_start, work_end, preferred_days, max_hours, tz = row
+            prefs = {
+                "work_start": work_start or _DEFAULT_WORK_START,
+                "work_end": work_end or _DEFAULT_WORK_END,
+                "preferred_days": preferred_days or _DEFAULT_DAYS,
+                "max_hours_per_day": int(max_hours) if max_hours is not None else 8,
+                "timezone": tz,
+            }
+        _cache_prefs(user_id, prefs)
+        return jsonify(prefs)
     finally:
         conn.close()
 
@@ -304,13 +351,15 @@ def put_preferences():
     except (TypeError, ValueError):
         return jsonify({"error": "unauthorized"}), 401
 
-    data = request.get_json() or {}
-    work_start = (data.get("work_start") or "09:00").strip()[:5]
-    work_end = (data.get("work_end") or "17:00").strip()[:5]
+    # cache=False: the body is read exactly once, so skip Flask's parsed-JSON
+    # caching on the request object.
+    data = request.get_json(cache=False) or {}
+    work_start = (data.get("work_start") or _DEFAULT_WORK_START).strip()[:5]
+    work_end = (data.get("work_end") or _DEFAULT_WORK_END).strip()[:5]
     preferred_days = data.get("preferred_days")
     if isinstance(preferred_days, list):
         preferred_days = ",".join(str(d).strip()[:2].upper() for d in preferred_days if d)
-    preferred_days = (preferred_days or "MO,TU,WE,TH,FR").strip()[:50]
+    preferred_days = (preferred_days or _DEFAULT_DAYS).strip()[:50]
     max_hours = data.get("max_hours_per_day")
     try:
         max_hours = max(1, min(24, int(max_hours))) if max_hours is not None else 8
@@ -335,4 +384,14 @@ def put_preferences():
     finally:
         conn.close()
 
-    return get_preferences()
+    # The normalized values just written are the response; re-running
+    # get_preferences would only re-read them.
+    prefs = {
+        "work_start": work_start,
+        "work_end": work_end,
+        "preferred_days": preferred_days,
+        "max_hours_per_day": max_hours,
+        "timezone": timezone,
+    }
+    _cache_prefs(user_id, prefs)
+    return jsonify(prefs)
@@ -1,6 +1,78 @@
-"""Admin audit log. Records who did what, when."""
+"""Admin audit log. Records who did what, when.
+
+Writes go through an in-memory queue drained by a background thread, so
+the INSERT+commit happens off the request path and a burst of queued
+rows lands in one executemany. The queue drops rows when full and the
+writer swallows DB errors, matching the old "audit never blocks
+operations" behavior.
+"""
+import atexit
+import queue
+import threading
+
 from app.api.auth import get_db
 
+_INSERT_SQL = """INSERT INTO AdminAuditLog
+   (admin_user_id, admin_username, action, target_user_id, target_username, details)
+   VALUES (%s, %s, %s, %s, %s, %s)"""
+
+_queue: queue.Queue = queue.Queue(maxsize=10000)
+_worker_started = False
+_worker_lock = threading.Lock()
+
+
+def _write_rows(rows) -> None:
+    """Insert a batch; silently ignores DB errors so audit never blocks."""
+    try:
+        conn = get_db()
+        try:
+            cur = conn.cursor()
+            cur.executemany(_INSERT_SQL, rows)
+            conn.commit()
+        finally:
+            conn.close()
+    except Exception:
+        pass
+
+
+def _drain_forever() -> None:
+    while True:
+        rows = [_queue.get()]
+        try:
+            while len(rows) < 100:
+                rows.append(_queue.get_nowait())
+        except queue.Empty:
+            pass
+        _write_rows(rows)
+
+
+def _flush_remaining() -> None:
+    """atexit hook: write whatever is still queued before the process exits."""
+    rows = []
+    try:
+        while True:
+            rows.append(_queue.get_nowait())
+    except queue.Empty:
+        pass
+    if rows:
+        _write_rows(rows)
+
+
+def _ensure_worker() -> None:
+    """Starts the drain thread on first use (not at import, so tests and
+    tooling that never log stay free of background threads)."""
+    global _worker_started
+    if _worker_started:
+        return
+    with _worker_lock:
+        if _worker_started:
+            return
+        threading.Thread(
+            target=_drain_forever, name="audit-writer", daemon=True
+        ).start()
+        atexit.register(_flush_remaining)
+        _worker_started = True
+
 
 def log_admin_action(
     admin_id: int,
@@ -10,26 +82,18 @@ def log_admin_action(
     target_username: str | None = None,
     details: str | None = None,
 ) -> None:
-    """Log an admin action. Silently ignores DB errors so audit never blocks operations."""
+    """Queue an admin action for the background writer. Drops the row if the
+    queue is full so audit never blocks admin operations."""
+    row = (
+        admin_id,
+        (admin_username or "")[:50],
+        (action or "")[:50],
+        target_user_id,
+        (target_username or "")[:50] if target_username else None,
+        details[:2000] if details else None,
+    )
+    _ensure_worker()
     try:
-        conn = get_db()
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                """INSERT INTO AdminAuditLog
-                   (admin_user_id, admin_username, action, target_user_id, target_username, details)
-                   VALUES (%s, %s, %s, %s, %s, %s)""",
-                (
-                    admin_id,
-                    (admin_username or "")[:50],
-                    (action or "")[:50],
-                    target_user_id,
-                    (target_username or "")[:50] if target_username else None,
-                    details[:2000] if details else None,
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
-    except Exception:
-        pass  # Never let audit logging block admin operations
+        _queue.put_nowait(row)
+    except queue.Full:
+        pass
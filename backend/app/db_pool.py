@@ -0,0 +1,68 @@
+"""Process-wide MySQL connection pool.
+
+Connections come from a single `MySQLConnectionPool` created lazily on first
+use (never at import time, so tests can mock `get_db` freely). Calling
+`close()` on a pooled connection returns it to the pool instead of tearing
+down the TCP/TLS session, which removes the handshake + auth round-trips
+that per-request `mysql.connector.connect()` pays on every call.
+
+Pool size comes from DB_POOL_SIZE (default 20, capped at mysql.connector's
+max of 32). If pool creation fails (e.g. DB briefly unreachable at startup)
+we fall back to a direct connection so behavior matches the old code path.
+"""
+import os
+import threading
+
+import mysql.connector
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _connect_kwargs():
+    """Connection kwargs from DB_* environment variables."""
+    port = os.getenv("DB_PORT", "3306")
+    try:
+        port = int(port)
+    except (TypeError, ValueError):
+        port = 3306
+    return {
+        "host": os.getenv("DB_HOST", "localhost"),
+        "port": port,
+        "user": os.getenv("DB_USER"),
+        "password": os.getenv("DB_PASSWORD"),
+        "database": os.getenv("DB_NAME"),
+        "connection_timeout": 15,
+    }
+
+
+def _pool_size() -> int:
+    """Pool size from DB_POOL_SIZE env; mysql.connector allows at most 32."""
+    try:
+        size = int(os.getenv("DB_POOL_SIZE", "20"))
+    except (TypeError, ValueError):
+        size = 20
+    return max(1, min(size, 32))
+
+
+def get_connection():
+    """Returns a pooled MySQL connection; `close()` releases it to the pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                try:
+                    _pool = mysql.connector.pooling.MySQLConnectionPool(
+                        pool_name="syllabify",
+                        pool_size=_pool_size(),
+                        **_connect_kwargs(),
+                    )
+                except Exception:
+                    # Pool creation needs a reachable DB; fall back to the
+                    # old direct-connect behavior rather than failing here.
+                    return mysql.connector.connect(**_connect_kwargs())
+    try:
+        return _pool.get_connection()
+    except Exception:
+        # Pool exhausted (all connections checked out): direct connection.
+        return mysql.connector.connect(**_connect_kwargs())
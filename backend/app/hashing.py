@@ -0,0 +1,40 @@
+"""Bounded worker pool for bcrypt password hashing.
+
+bcrypt is deliberately slow (tens to hundreds of ms per hash) and releases
+the GIL while it runs, so hashing on a small thread pool gets real
+parallelism without process-spawn overhead. The pool is sized to the CPU
+count (override with HASH_WORKERS), which caps concurrent hashes: a burst
+of registrations or admin password resets queues here instead of putting a
+bcrypt run on every request thread at once.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+
+def _max_workers() -> int:
+    try:
+        workers = int(os.getenv("HASH_WORKERS", "0"))
+    except (TypeError, ValueError):
+        workers = 0
+    return workers if workers > 0 else (os.cpu_count() or 2)
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=_max_workers(), thread_name_prefix="pw-hash"
+)
+
+
+def _hash(password: str) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+
+def hash_password(password: str) -> str:
+    """Hashes a password on the worker pool; blocks until the hash is ready."""
+    return _executor.submit(_hash, password).result()
+
+
+def hash_passwords(passwords):
+    """Hashes a batch concurrently (bcrypt releases the GIL); preserves order."""
+    return list(_executor.map(_hash, passwords))
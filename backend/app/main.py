@@ -7,13 +7,17 @@
 
 import os
 
-import mysql.connector
+import orjson
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+from app.admin_settings import get_announcement_banner, get_registration_enabled
+from app.api.admin import _is_admin
 from app.api.admin import bp as admin_bp
 from app.api.assignments import bp as assignments_bp
 from app.api.auth import bp as auth_bp
+from app.api.auth import decode_token
 from app.api.calendar import bp as calendar_bp
 from app.api.courses import bp as courses_bp
 from app.api.schedule import bp as schedule_bp
@@ -21,8 +25,23 @@ from app.api.syllabus import bp as syllabus_bp
 from app.api.terms import bp as terms_bp
 from app.api.uploads import bp as uploads_bp
 from app.api.users import bp as users_bp
+from app.maintenance import get_maintenance_status
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify via orjson (C encoder): one bytes buffer instead of the
+    stdlib's many small string joins. Matters most for the big list
+    responses (admin users, audit log, courses)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 # CORS: set FRONTEND_URL on Render to your Vercel URL (e.g. https://syllabify-iota.vercel.app)
 _frontend_origins = os.getenv("FRONTEND_URL", "http://localhost:3000").strip()
 _frontend_origins = [o.strip() for o in _frontend_origins.split(",") if o.strip()]
@@ -37,60 +56,71 @@ CORS(
 
 
 def get_db_connection():
-    """Creates and returns a MySQL connection using DB_* environment variables."""
-    port = os.getenv("DB_PORT", "3306")
-    try:
-        port = int(port)
-    except (TypeError, ValueError):
-        port = 3306
-    return mysql.connector.connect(
-        host=os.getenv("DB_HOST", "mysql"),
-        port=port,
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        database=os.getenv("DB_NAME"),
-        connection_timeout=15,
-    )
+    """Returns a pooled MySQL connection using DB_* environment variables."""
+    from app.db_pool import get_connection
+
+    return get_connection()
 
 
 def _maintenance_check():
     """Before request: block non-admins when maintenance is on. Skip login, register, maintenance endpoint."""
     if app.testing:
         return None
-    from app.api.admin import _is_admin
-    from app.api.auth import decode_token
-    from app.maintenance import get_maintenance_status
-
     if request.method == "OPTIONS":
         return None
     path = request.path or ""
-    if path in ("/api/maintenance", "/api/settings") and request.method == "GET":
+    if path in ("/api/maintenance", "/api/settings", "/api/bootstrap") and request.method == "GET":
         return None
     if path in ("/api/auth/login", "/api/auth/register", "/api/auth/google"):
         return None
     if path.startswith("/api/calendar/callback"):
         return None
-    enabled, _ = get_maintenance_status()
+    enabled, message = get_maintenance_status()
     if not enabled:
         return None
     auth = request.headers.get("Authorization")
     payload = decode_token(auth)
     if not payload:
-        return jsonify({"error": "maintenance", "message": get_maintenance_status()[1]}), 503
+        return jsonify({"error": "maintenance", "message": message}), 503
     username = (payload.get("username") or "").strip()
     if _is_admin(username):
         return None
-    return jsonify({"error": "maintenance", "message": get_maintenance_status()[1]}), 503
+    return jsonify({"error": "maintenance", "message": message}), 503
 
 
 app.before_request(_maintenance_check)
 
+_warmed_up = False
+
+
+def _warmup():
+    """First-request hook: pull the remaining lazy work forward so the first
+    real request per gunicorn worker doesn't pay cold-start costs. Blueprint
+    modules are already imported above; this touches the pieces that stay
+    lazy — PyJWT's decode machinery and the connection pool."""
+    global _warmed_up
+    if _warmed_up or app.testing:
+        return None
+    _warmed_up = True
+    # A throwaway encode/decode round-trip loads PyJWT's algorithm tables.
+    import jwt
+
+    jwt.decode(jwt.encode({}, "warmup", algorithm="HS256"), "warmup", algorithms=["HS256"])
+    try:
+        from app.db_pool import get_connection
+
+        get_connection().close()
+    except Exception:
+        pass  # DB may still be coming up; the pool is created on demand anyway
+    return None
+
+
+app.before_request(_warmup)
+
 
 @app.route("/api/maintenance", methods=["GET"])
 def get_maintenance():
     """Public endpoint. Returns maintenance status. No auth required."""
-    from app.maintenance import get_maintenance_status
-
     enabled, message = get_maintenance_status()
     return jsonify({"enabled": enabled, "message": message})
 
@@ -98,9 +128,20 @@ def get_maintenance():
 @app.route("/api/settings", methods=["GET"])
 def get_settings():
     """Public endpoint. Returns registration and announcement. No auth required."""
-    from app.admin_settings import get_announcement_banner, get_registration_enabled
+    return jsonify({
+        "registration_open": get_registration_enabled(),
+        "announcement": get_announcement_banner(),
+    })
+
 
+@app.route("/api/bootstrap", methods=["GET"])
+def get_bootstrap():
+    """Public endpoint. Maintenance status plus settings in one round-trip so
+    page load needs one request instead of /api/maintenance + /api/settings.
+    Those endpoints remain for existing clients."""
+    enabled, message = get_maintenance_status()
     return jsonify({
+        "maintenance": {"enabled": enabled, "message": message},
         "registration_open": get_registration_enabled(),
         "announcement": get_announcement_banner(),
     })
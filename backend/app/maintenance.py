@@ -1,9 +1,21 @@
 """Maintenance mode: read/write AdminSettings. Used by before_request and admin API."""
+from time import monotonic
+
 from app.api.auth import get_db
 
+# before_request calls get_maintenance_status on every request; a short TTL
+# keeps that to one SELECT per 5s per process instead of one per request.
+# Toggles made by another process are picked up when the TTL lapses.
+_STATUS_TTL = 5.0
+_status_cache: tuple[float, tuple] | None = None
+
 
 def get_maintenance_status():
     """Returns (enabled: bool, message: str). If table missing, (False, default message)."""
+    global _status_cache
+    cached = _status_cache
+    if cached and monotonic() - cached[0] < _STATUS_TTL:
+        return cached[1]
     conn = get_db()
     try:
         cur = conn.cursor(dictionary=True)
@@ -15,15 +27,20 @@ def get_maintenance_status():
         message = (
             rows.get("maintenance_message") or "Syllabify is undergoing maintenance. Please try again later."
         ).strip() or "Syllabify is undergoing maintenance. Please try again later."
+        _status_cache = (monotonic(), (enabled, message))
         return enabled, message
     except Exception:
-        return False, "Syllabify is undergoing maintenance. Please try again later."
+        # Cache the fallback too so a broken table/DB isn't probed per request.
+        status = (False, "Syllabify is undergoing maintenance. Please try again later.")
+        _status_cache = (monotonic(), status)
+        return status
     finally:
         conn.close()
 
 
 def set_maintenance(enabled, message):
     """Set maintenance mode. Returns True on success."""
+    global _status_cache
     conn = get_db()
     try:
         cur = conn.cursor()
@@ -38,6 +55,7 @@ def set_maintenance(enabled, message):
             (message or "Syllabify is undergoing maintenance. Please try again later.",),
         )
         conn.commit()
+        _status_cache = None  # force the next read to see the new state
         return True
     except Exception:
         return False
@@ -16,9 +16,13 @@ class Course(Base):
     study_hours_per_week: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     term = relationship("Term", back_populates="courses")
+    # High-fanout collections load via selectin (one IN query per
+    # relationship) rather than one lazy SELECT per course.
     assignments = relationship(
-        "Assignment", back_populates="course", cascade="all, delete-orphan"
+        "Assignment", back_populates="course", cascade="all, delete-orphan",
+        lazy="selectin",
     )
     meetings = relationship(
-        "Meeting", back_populates="course", cascade="all, delete-orphan"
+        "Meeting", back_populates="course", cascade="all, delete-orphan",
+        lazy="selectin",
     )
@@ -26,11 +26,15 @@ class Term(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP, default=datetime.utcnow)
 
-    # Relationships
+    # Relationships. The collections default to selectin loading: one
+    # WHERE term_id IN (...) per relationship instead of a lazy SELECT per
+    # parent row when serializing a term tree.
     owner = relationship("User", back_populates="terms")
     courses = relationship(
-        "Course", back_populates="term", cascade="all, delete-orphan"
+        "Course", back_populates="term", cascade="all, delete-orphan",
+        lazy="selectin",
     )
     study_times = relationship(
-        "StudyTime", back_populates="term", cascade="all, delete-orphan"
+        "StudyTime", back_populates="term", cascade="all, delete-orphan",
+        lazy="selectin",
     )
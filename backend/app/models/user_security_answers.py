@@ -8,7 +8,9 @@ class UserSecurityAnswer(Base):
     __tablename__ = "UserSecurityAnswers"
 
     id: Mapped[int] = mapped_column(
-        primary_key = True
+        Integer,
+        primary_key = True,
+        autoincrement = True
     )
 
     user_id: Mapped[int] = mapped_column(
@@ -9,6 +9,14 @@ import re
 # Model: GPT-4o-mini for cost-effective structured extraction
 LLM_MODEL = "gpt-4o-mini"
 
+# Normalize day_of_week: Tuesday -> TU, Th -> TH, etc.
+_DAY_MAP = {
+    "monday": "MO", "tuesday": "TU", "wednesday": "WE", "thursday": "TH",
+    "friday": "FR", "saturday": "SA", "sunday": "SU",
+    "mon": "MO", "tue": "TU", "wed": "WE", "thu": "TH", "fri": "FR",
+    "mo": "MO", "tu": "TU", "we": "WE", "th": "TH", "fr": "FR", "sa": "SA", "su": "SU",
+}
+
 SYSTEM_PROMPT = """You are a syllabus parser. Extract course info, meeting times, and assessments from the provided syllabus sections.
 
 Output strictly valid JSON matching the schema. Use ISO 8601 for dates (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS for times).
@@ -242,16 +250,9 @@ def _validate_and_normalize(data: dict) -> dict:
     assessments = data.get("assessments") or []
     categories = data.get("assessment_categories") or []
 
-    # Normalize day_of_week: Tuesday -> TU, Th -> TH, etc.
-    day_map = {
-        "monday": "MO", "tuesday": "TU", "wednesday": "WE", "thursday": "TH",
-        "friday": "FR", "saturday": "SA", "sunday": "SU",
-        "mon": "MO", "tue": "TU", "wed": "WE", "thu": "TH", "fri": "FR",
-        "mo": "MO", "tu": "TU", "we": "WE", "th": "TH", "fr": "FR", "sa": "SA", "su": "SU",
-    }
     for m in course.get("meeting_times") or []:
         d = (m.get("day_of_week") or "").strip().lower()
-        m["day_of_week"] = day_map.get(d, day_map.get(d[:2], d.upper()[:2] if len(d) >= 2 else d))
+        m["day_of_week"] = _DAY_MAP.get(d, _DAY_MAP.get(d[:2], d.upper()[:2] if len(d) >= 2 else d))
 
     # Ensure IDs
     cat_ids = {c.get("id") for c in categories if c.get("id")}
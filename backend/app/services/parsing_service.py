@@ -13,6 +13,20 @@ from app.utils.document_utils import (
     extract_text_from_file,
 )
 
+# Prose-extraction patterns, compiled once at import. These run over whole
+# syllabi and are large enough that relying on re's internal LRU cache (512
+# entries, evicted under load) is risky on the hot parse path.
+# "X due DATE" (e.g. "Assignment 1 due Feb 15")
+_PROSE_DUE_RE = re.compile(
+    r"([^\n]{3,80}?)\s+due\s+(\d{1,2}[/\-]\d{1,2}(?:[/\-]\d{2,4})?|\w+\s+\d{1,2}(?:,?\s*\d{4})?)",
+    re.I,
+)
+# "Feb 15 - Assignment 1" or "2/15: Midterm"
+_PROSE_DATE_PREFIX_RE = re.compile(
+    r"(\d{1,2}[/\-]\d{1,2}(?:[/\-]\d{2,4})?|\w+\s+\d{1,2}(?:,?\s*\d{4})?)\s*[:\-]\s*([^\n\.]{5,80})",
+    re.I,
+)
+
 
 def compute_parse_confidence(parser_result: dict | None, course_name: str, assignments: list) -> dict:
     """
@@ -527,11 +541,7 @@ def _extract_from_prose(text: str) -> list:
     seen = set()  # avoid duplicates: (name, due)
 
     # Simple: "X due DATE" (e.g. "Assignment 1 due Feb 15")
-    for m in re.finditer(
-        r"([^\n]{3,80}?)\s+due\s+(\d{1,2}[/\-]\d{1,2}(?:[/\-]\d{2,4})?|\w+\s+\d{1,2}(?:,?\s*\d{4})?)",
-        text,
-        re.I,
-    ):
+    for m in _PROSE_DUE_RE.finditer(text):
         name = m.group(1).strip()
         date_str = m.group(2).strip()
         due = parse_due_date(date_str)
@@ -546,11 +556,7 @@ def _extract_from_prose(text: str) -> list:
                 })
 
     # Pattern: "Feb 15 - Assignment 1" or "2/15: Midterm"
-    for m in re.finditer(
-        r"(\d{1,2}[/\-]\d{1,2}(?:[/\-]\d{2,4})?|\w+\s+\d{1,2}(?:,?\s*\d{4})?)\s*[:\-]\s*([^\n\.]{5,80})",
-        text,
-        re.I,
-    ):
+    for m in _PROSE_DATE_PREFIX_RE.finditer(text):
         date_str, name = m.group(1).strip(), m.group(2).strip()
         due = parse_due_date(date_str)
         if name and len(name) > 2 and len(name) < 80:
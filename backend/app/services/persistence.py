@@ -0,0 +1,34 @@
+# Core bulk-insert helpers for the scheduling persistence path.
+# The ORM unit of work emits one INSERT per pending object on MySQL; a Core
+# insert with a list of parameter dicts collapses a batch into a single
+# executemany round-trip.
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.study_time import StudyTime
+
+
+def bulk_insert_study_times(session: Session, study_times: list[StudyTime]) -> None:
+    """Insert a batch of StudyTime instances in one round-trip.
+
+    The instances are never attached to the session, so callers keep using
+    the in-memory objects they built (the API responses only read the
+    attributes set at construction, not DB-generated ids).
+    """
+    if not study_times:
+        return
+    session.execute(
+        insert(StudyTime),
+        [
+            {
+                "start_time": st.start_time,
+                "end_time": st.end_time,
+                "term_id": st.term_id,
+                "notes": st.notes,
+                "assignment_id": st.assignment_id,
+                "course_id": st.course_id,
+            }
+            for st in study_times
+        ],
+    )
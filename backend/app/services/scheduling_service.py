@@ -6,11 +6,12 @@
 #
 # DISCLAIMER: Project structure may change. Functions may be added or modified.
 
+import os
 import re as _re
 from datetime import date, datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 # Import all models referenced by Term's relationships so SQLAlchemy can resolve
 # them when configuring the mapper (avoids InvalidRequestError: failed to locate 'User').
@@ -24,6 +25,11 @@ from app.models.meeting import Meeting  # noqa: F401
 from app.models.study_time import StudyTime
 from app.models.term import Term
 from app.models.user import User  # noqa: F401
+from app.services.persistence import bulk_insert_study_times
+
+# Opt-in strict loading: raiseload("*") turns any lazy load not covered by the
+# explicit selectin options into an error. Meant for CI/tests; off in prod.
+_STRICT_LOADING = os.getenv("SQLA_STRICT_LOADING", "").strip().lower() in ("1", "true", "yes")
 
 # Default study window (can be overridden by user preferences later).
 DEFAULT_STUDY_START = time(8, 0)   # 8:00 AM
@@ -89,35 +95,41 @@ def _meetings_to_busy_intervals(
     term_end = term.end_date
     if term_start is None or term_end is None:
         return intervals
+    # Parse each meeting once (day code + "HH:MM" strings) instead of
+    # re-parsing on every day of the term: O(meetings) parses rather than
+    # O(days x meetings).
+    recurring: dict[int, list[tuple[time, time]]] = {}
+    for course in courses:
+        for meeting in course.meetings:
+            # Recurring: day_of_week + start_time_str, end_time_str
+            if meeting.day_of_week and meeting.start_time_str and meeting.end_time_str:
+                day_code = (meeting.day_of_week or "").strip().upper()
+                weekday = _DAY_CODE_TO_WEEKDAY.get(day_code)
+                if weekday is None:
+                    continue
+                start_t = _parse_time_str(meeting.start_time_str)
+                end_t = _parse_time_str(meeting.end_time_str)
+                if start_t is None or end_t is None or end_t <= start_t:
+                    continue
+                recurring.setdefault(weekday, []).append((start_t, end_t))
+            # Legacy one-off: start_time, end_time
+            elif meeting.start_time is not None and meeting.end_time is not None:
+                s, e = meeting.start_time, meeting.end_time
+                if s.tzinfo is None:
+                    s = s.replace(tzinfo=tz)
+                if e.tzinfo is None:
+                    e = e.replace(tzinfo=tz)
+                if e > s:
+                    intervals.append((s, e))
+
     current = term_start
     one_day = timedelta(days=1)
     while current <= term_end:
-        for course in courses:
-            for meeting in course.meetings:
-                # Recurring: day_of_week + start_time_str, end_time_str
-                if meeting.day_of_week and meeting.start_time_str and meeting.end_time_str:
-                    day_code = (meeting.day_of_week or "").strip().upper()
-                    weekday = _DAY_CODE_TO_WEEKDAY.get(day_code)
-                    if weekday is None or current.weekday() != weekday:
-                        continue
-                    start_t = _parse_time_str(meeting.start_time_str)
-                    end_t = _parse_time_str(meeting.end_time_str)
-                    if start_t is None or end_t is None:
-                        continue
-                    start_dt = datetime.combine(current, start_t, tzinfo=tz)
-                    end_dt = datetime.combine(current, end_t, tzinfo=tz)
-                    if end_dt <= start_dt:
-                        continue
-                    intervals.append((start_dt, end_dt))
-                # Legacy one-off: start_time, end_time
-                elif meeting.start_time is not None and meeting.end_time is not None:
-                    s, e = meeting.start_time, meeting.end_time
-                    if s.tzinfo is None:
-                        s = s.replace(tzinfo=tz)
-                    if e.tzinfo is None:
-                        e = e.replace(tzinfo=tz)
-                    if e > s:
-                        intervals.append((s, e))
+        for start_t, end_t in recurring.get(current.weekday(), ()):
+            intervals.append((
+                datetime.combine(current, start_t, tzinfo=tz),
+                datetime.combine(current, end_t, tzinfo=tz),
+            ))
         current += one_day
     return intervals
 
@@ -289,8 +301,8 @@ def generate_study_times(
     - Respects max_hours_per_day (from UserPreferences or param).
     - Tries to minimize the maximum study minutes on any single day.
 
-    Returns the list of created StudyTime instances (already added to session;
-    caller should commit).
+    Returns the list of created StudyTime instances (rows are written with one
+    Core bulk INSERT unless dry_run; caller should commit).
     """
     start_time = study_start if study_start is not None else DEFAULT_STUDY_START
     end_time = study_end if study_end is not None else DEFAULT_STUDY_END
@@ -300,13 +312,18 @@ def generate_study_times(
         max_hours = 8  # fallback when called without prefs (e.g. tests)
     del study_start, study_end, max_hours_per_day
 
+    # selectin: one IN query per collection. The old chained joinedloads
+    # multiplied rows (courses x assignments x meetings) in a single join.
+    options = [
+        selectinload(Term.courses).selectinload(Course.assignments),
+        selectinload(Term.courses).selectinload(Course.meetings),
+        selectinload(Term.study_times),
+    ]
+    if _STRICT_LOADING:
+        options.append(raiseload("*"))
     term = (
         session.query(Term)
-        .options(
-            joinedload(Term.courses).joinedload(Course.assignments),
-            joinedload(Term.courses).joinedload(Course.meetings),
-            joinedload(Term.study_times),
-        )
+        .options(*options)
         .filter(Term.id == term_id)
         .first()
     )
@@ -548,8 +565,6 @@ def generate_study_times(
                 assignment_id=aid,
                 course_id=assignment.course_id,
             )
-            if not dry_run:
-                session.add(st)
             created.append(st)
         busy.extend(used_slots)
         busy = _merge_intervals(busy)
@@ -558,6 +573,11 @@ def generate_study_times(
             all_fully_allocated = False
 
     if all_fully_allocated:
+        # One Core executemany instead of one ORM INSERT per slot. Phase-1
+        # objects never enter the session, so falling through to phase 2
+        # leaves nothing pending to flush.
+        if not dry_run:
+            bulk_insert_study_times(session, created)
         return created
 
     # ----- Phase 2: Global solver fallback (minimize max daily study time) -----
@@ -874,8 +894,8 @@ def _generate_study_times_global(
                 assignment_id=aid,
                 course_id=a.course_id,
             )
-            if not dry_run:
-                session.add(st)
             created.append(st)
 
+    if not dry_run:
+        bulk_insert_study_times(session, created)
     return created
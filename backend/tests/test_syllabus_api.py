@@ -112,7 +112,10 @@ def test_list_courses(decode_token, get_db, client):
     conn = MagicMock()
     cur = MagicMock()
     cur.fetchone.return_value = {"id": 1}  # term exists
-    cur.fetchall.return_value = [{"id": 1, "course_name": "CS 422", "assignment_count": 3}]
+    cur.fetchmany.side_effect = [
+        [{"id": 1, "course_name": "CS 422", "assignment_count": 3}],
+        [],
+    ]
     conn.cursor.return_value = cur
     get_db.return_value = conn
 
@@ -0,0 +1,68 @@
+"""Integration tests for GET /api/terms."""
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    app.config["TESTING"] = True
+    return app.test_client()
+
+
+def _jwt_payload():
+    return {"sub": "1", "username": "syllabify-client"}
+
+
+auth_headers = {"Authorization": "Bearer fake-token"}
+
+
+@patch("app.api.terms.decode_token")
+def test_list_terms_requires_auth(decode_token, client):
+    decode_token.return_value = None
+    res = client.get("/api/terms", headers=auth_headers)
+    assert res.status_code == 401
+
+
+@patch("app.api.terms.get_db")
+@patch("app.api.terms.decode_token")
+def test_list_terms(decode_token, get_db, client):
+    decode_token.return_value = _jwt_payload()
+    conn = MagicMock()
+    cur = MagicMock()
+    # Tuple rows in SELECT order: id, term_name, start_date, end_date,
+    # is_active, created_at, course_count, assignment_count.
+    cur.fetchmany.side_effect = [
+        [
+            (
+                1,
+                "Fall 2025",
+                date(2025, 9, 29),
+                date(2025, 12, 12),
+                1,
+                datetime(2025, 9, 1, 8, 30, 0),
+                2,
+                5,
+            ),
+        ],
+        [],
+    ]
+    conn.cursor.return_value = cur
+    get_db.return_value = conn
+
+    res = client.get("/api/terms", headers=auth_headers)
+    assert res.status_code == 200
+    data = res.get_json()
+    assert len(data["terms"]) == 1
+    term = data["terms"][0]
+    assert term["id"] == 1
+    assert term["term_name"] == "Fall 2025"
+    # Dates must serialize as the ISO strings the frontend expects.
+    assert term["start_date"] == "2025-09-29"
+    assert term["end_date"] == "2025-12-12"
+    assert term["created_at"] == "2025-09-01T08:30:00"
+    assert term["course_count"] == 2
+    assert term["assignment_count"] == 5
@@ -0,0 +1,10 @@
+-- Functional index so the admin check SELECT is_admin FROM Users
+-- WHERE LOWER(username) = ? uses an index instead of a full scan.
+-- Requires MySQL 8.0.13+.
+CREATE INDEX ix_users_lower_username ON Users ((LOWER(username)));
+
+-- On MySQL < 8.0.13 (no functional indexes) use a stored generated
+-- column instead and point the query at it:
+--   ALTER TABLE Users
+--       ADD COLUMN username_lc VARCHAR(255) AS (LOWER(username)) STORED,
+--       ADD INDEX ix_users_username_lc (username_lc);
@@ -0,0 +1,11 @@
+-- Composite indexes for the course read paths. The single-column lookups
+-- (Assignments.course_id, Meetings.course_id, Courses.term_id,
+-- Terms.user_id) are already covered by the indexes InnoDB creates for
+-- their foreign keys; these extend the two child tables so the hot
+-- queries avoid a filesort / second lookup:
+--   get_course: assignments per course ORDER BY due_date reads the
+--   (course_id, due_date) index in order.
+--   get_course / engine input: meetings per course filtered on
+--   day_of_week IS NOT NULL are satisfied from (course_id, day_of_week).
+CREATE INDEX ix_assignments_course_due ON Assignments (course_id, due_date);
+CREATE INDEX ix_meetings_course_day ON Meetings (course_id, day_of_week);